@@ -1,16 +1,19 @@
 # If extensions (or modules to document with autodoc) are in another directory,
 # add these directories to sys.path here. If the directory is relative to the
-# documentation root, use os.path.abspath to make it absolute, like shown here.
-from sys import path as sys_path
-from os.path import abspath
+# documentation root, resolve it relative to ROOT to make it absolute, like shown here.
+from os import environ, scandir
 from pathlib import Path
+from subprocess import check_output, CalledProcessError, DEVNULL
+from sys import path as sys_path
+from tempfile import gettempdir
+from typing import Optional, Tuple
 
 from pyTooling.Packaging import extractVersionInformation
+from sphinx.util.logging import getLogger
 
 ROOT = Path(__file__).resolve().parent
 
-sys_path.insert(0, abspath("."))
-sys_path.insert(0, abspath(".."))
+sys_path[:0] = [str(ROOT.parent), str(ROOT)]
 # sys_path.insert(0, abspath("../pyEDAA/Reports"))
 # sys_path.insert(0, abspath("_extensions"))
 
@@ -59,13 +62,11 @@ pygments_style = "manni"
 # ==============================================================================
 # Restructured Text settings
 # ==============================================================================
-prologPath = "prolog.inc"
-try:
-	with open(prologPath, "r") as prologFile:
-		rst_prolog = prologFile.read()
-except Exception as ex:
+prologPath = ROOT / "prolog.inc"
+if prologPath.is_file():
+	rst_prolog = prologPath.read_text(encoding="utf-8")
+else:
 	print(f"[ERROR:] While reading '{prologPath}'.")
-	print(ex)
 	rst_prolog = ""
 
 
@@ -85,10 +86,14 @@ html_css_files = [
 # Add any paths that contain custom static files (such as style sheets) here,
 # relative to this directory. They are copied after the builtin static files,
 # so a file named "default.css" will overwrite the builtin "default.css".
-html_static_path = ["_static"]
+html_static_path = ("_static", )
 
-html_logo = str(Path(html_static_path[0]) / "logo.svg")
-html_favicon = str(Path(html_static_path[0]) / "favicon.svg")
+# Look up logo and favicon with a single directory scan. A missing file results in None instead of a broken path.
+with scandir(ROOT / html_static_path[0]) as entries:
+	staticFiles = {entry.name: f"{html_static_path[0]}/{entry.name}" for entry in entries if entry.is_file()}
+
+html_logo = staticFiles.get("logo.svg")
+html_favicon = staticFiles.get("favicon.svg")
 
 # Output file base name for HTML help builder.
 htmlhelp_basename = f"{project.replace('.', '')}Doc"
@@ -98,17 +103,44 @@ htmlhelp_basename = f"{project.replace('.', '')}Doc"
 # The empty string is equivalent to '%b %d, %Y'.
 html_last_updated_fmt = "%d.%m.%Y"
 
+# Sphinx uses SOURCE_DATE_EPOCH instead of the current time for the timestamp above. Derive it from the last commit, so
+# generated pages are byte-identical between builds of the same sources.
+if "SOURCE_DATE_EPOCH" not in environ:
+	try:
+		lastCommitTime = check_output(["git", "log", "-1", "--format=%ct"], cwd=ROOT, stderr=DEVNULL, text=True).strip()
+	except (OSError, CalledProcessError):
+		lastCommitTime = ""
+
+	if lastCommitTime != "":
+		environ["SOURCE_DATE_EPOCH"] = lastCommitTime
+
 # ==============================================================================
 # Python settings
 # ==============================================================================
-modindex_common_prefix = [
-	f"{project}."
-]
+modindex_common_prefix = (
+	f"{project}.",
+)
 
 # ==============================================================================
 # Options for LaTeX / PDF output
 # ==============================================================================
-from textwrap import dedent
+# Additional stuff for the LaTeX preamble.
+latexPreamble = r"""
+% ================================================================================
+% User defined additional preamble code
+% ================================================================================
+% Add more Unicode characters for pdfLaTeX.
+% - Alternatively, compile with XeLaTeX or LuaLaTeX.
+% - https://GitHub.com/sphinx-doc/sphinx/issues/3511
+%
+\ifdefined\DeclareUnicodeCharacter
+	\DeclareUnicodeCharacter{2265}{$\geq$}
+	\DeclareUnicodeCharacter{21D2}{$\Rightarrow$}
+\fi
+
+
+% ================================================================================
+"""
 
 latex_elements = {
 	# The paper size ('letterpaper' or 'a4paper').
@@ -118,22 +150,7 @@ latex_elements = {
 	#'pointsize': '10pt',
 
 	# Additional stuff for the LaTeX preamble.
-	"preamble": dedent(r"""
-		% ================================================================================
-		% User defined additional preamble code
-		% ================================================================================
-		% Add more Unicode characters for pdfLaTeX.
-		% - Alternatively, compile with XeLaTeX or LuaLaTeX.
-		% - https://GitHub.com/sphinx-doc/sphinx/issues/3511
-		%
-		\ifdefined\DeclareUnicodeCharacter
-			\DeclareUnicodeCharacter{2265}{$\geq$}
-			\DeclareUnicodeCharacter{21D2}{$\Rightarrow$}
-		\fi
-
-
-		% ================================================================================
-		"""),
+	"preamble": latexPreamble,
 
 	# Latex figure (float) alignment
 	#'figure_align': 'htbp',
@@ -142,19 +159,21 @@ latex_elements = {
 # Grouping the document tree into LaTeX files. List of tuples
 # (source start file, target name, title,
 #  author, documentclass [howto, manual, or own class]).
-latex_documents = [
+latex_documents = (
 	( master_doc,
 		f"{project}.tex",
 		f"The {project} Documentation",
 		f"Patrick Lehmann",
 		f"manual"
 	),
-]
+)
 
 
 # ==============================================================================
 # Extensions
 # ==============================================================================
+# The documentation is built in parallel (see SPHINXJOBS in the Makefile). Sphinx falls back to serial reading, if an
+# extension doesn't declare itself 'parallel_read_safe' (e.g. autoapi and sphinx_reports), but writing stays parallel.
 extensions = [
 # Standard Sphinx extensions
 	"sphinx.ext.autodoc",
@@ -181,11 +200,20 @@ extensions = [
 # ==============================================================================
 # Sphinx.Ext.InterSphinx
 # ==============================================================================
+# Inventories (objects.inv) stored as '_intersphinx/<name>-objects.inv' are used instead of downloading them on every
+# build. Run 'make intersphinx' to fetch them. If no local copy exists, the inventory is fetched from the remote
+# documentation.
+intersphinxDirectory = ROOT / "_intersphinx"
+
+def intersphinxInventory(name: str, url: str) -> Tuple[str, Optional[Tuple[str, None]]]:
+	localInventory = intersphinxDirectory / f"{name}-objects.inv"
+	return url, ((str(localInventory), None) if localInventory.is_file() else None)
+
 intersphinx_mapping = {
-	"python":    ("https://docs.python.org/3", None),
-	"pytooling": ("https://pytooling.github.io/pyTooling", None),
-	"ucis":      ("https://edaa-org.github.io/pyEDAA.UCIS", None),
-	"ghdl":      ("https://ghdl.github.io/ghdl", None),
+	"python":    intersphinxInventory("python",    "https://docs.python.org/3"),
+	"pytooling": intersphinxInventory("pytooling", "https://pytooling.github.io/pyTooling"),
+	"ucis":      intersphinxInventory("ucis",      "https://edaa-org.github.io/pyEDAA.UCIS"),
+	"ghdl":      intersphinxInventory("ghdl",      "https://ghdl.github.io/ghdl"),
 }
 
 
@@ -296,10 +324,29 @@ autoapi_modules = {
 	}
 }
 
-for directory in [mod for mod in Path(f"../{project.replace('.', '/')}").iterdir() if mod.is_dir() and mod.name != "__pycache__"]:
-	print(f"Adding module rule for '{project}.{directory.name}'")
-	autoapi_modules[f"{project}.{directory.name}"] = {
+# Classify all directory entries with a single scandir() pass (DirEntry caches the file type) and sort sub-packages by
+# name, so the generated configuration doesn't depend on the filesystem's directory order.
+with scandir(ROOT.parent / project.replace(".", "/")) as entries:
+	subPackages = sorted(entry.name for entry in entries if entry.is_dir() and entry.name != "__pycache__")
+
+for subPackage in subPackages:
+	print(f"Adding module rule for '{project}.{subPackage}'")
+	autoapi_modules[f"{project}.{subPackage}"] = {
 		"template": "module",
 		"output":   project,
 		"override": True
 	}
+
+
+# ==============================================================================
+# Sphinx setup
+# ==============================================================================
+# Incremental builds reuse the environment pickle stored in the doctree directory. CI should keep this directory in a
+# cached location: sphinx-build -j auto -d $CACHE/doctrees . _build/html
+def setup(app) -> None:
+	doctreeDirectory = Path(app.doctreedir).resolve()
+	if "CI" in environ and Path(gettempdir()).resolve() in doctreeDirectory.parents:
+		getLogger(__name__).warning(
+			f"Doctree directory '{doctreeDirectory}' is located in a temporary directory. "
+			f"Incremental documentation builds across CI runs are not possible."
+		)
@@ -34,14 +34,14 @@ Reader for JUnit unit testing summary files in XML format.
 """
 from pathlib              import Path
 from time                 import perf_counter_ns
-from typing               import Optional as Nullable, Generator, Tuple, Union, TypeVar, Type, ClassVar
+from typing               import Optional as Nullable, Dict, Generator, Tuple, Union, TypeVar, Type, ClassVar, List
 
-from lxml.etree           import ElementTree, Element, SubElement, tostring, _Element
+from lxml.etree           import Element, tostring, _Element
 from pyTooling.Common     import firstValue
 from pyTooling.Decorators import export, InheritDocString
 
 from pyEDAA.Reports.Unittesting       import UnittestException, TestsuiteKind
-from pyEDAA.Reports.Unittesting       import TestcaseStatus, TestsuiteStatus, IterationScheme
+from pyEDAA.Reports.Unittesting       import TestcaseStatus, IterationScheme
 from pyEDAA.Reports.Unittesting       import TestsuiteSummary as ut_TestsuiteSummary, Testsuite as ut_Testsuite
 from pyEDAA.Reports.Unittesting.JUnit import Testcase as ju_Testcase, Testclass as ju_Testclass, Testsuite as ju_Testsuite
 from pyEDAA.Reports.Unittesting.JUnit import TestsuiteSummary as ju_TestsuiteSummary, Document as ju_Document
@@ -105,18 +105,7 @@ class Testsuite(ju_Testsuite):
 		self._failed = failed
 		self._passed = passed
 
-		if errored > 0:
-			self._status = TestsuiteStatus.Errored
-		elif failed > 0:
-			self._status = TestsuiteStatus.Failed
-		elif tests == 0:
-			self._status = TestsuiteStatus.Empty
-		elif tests - skipped == passed:
-			self._status = TestsuiteStatus.Passed
-		elif tests == skipped:
-			self._status = TestsuiteStatus.Skipped
-		else:
-			self._status = TestsuiteStatus.Unknown
+		self._status = self._DeriveStatus(tests, skipped, errored, failed, passed)
 
 		return tests, skipped, errored, failed, passed
 
@@ -142,21 +131,27 @@ class Testsuite(ju_Testsuite):
 		juTestsuite._failed = testsuite._failed
 		juTestsuite._passed = testsuite._passed
 
+		# Test classes are memoized per parent test suite (by identity), thus a class path is assembled only once per test
+		# suite instead of once per test case.
+		testclasses: Dict[int, Testclass] = {}
 		for tc in testsuite.IterateTestcases():
 			ts = tc._parent
 			if ts is None:
 				raise UnittestException(f"Testcase '{tc._name}' is not part of a hierarchy.")
 
-			classname = ts._name
-			ts = ts._parent
-			while ts is not None and ts._kind > TestsuiteKind.Logical:
-				classname = f"{ts._name}.{classname}"
-				ts = ts._parent
+			juClass = testclasses.get(id(ts))
+			if juClass is None:
+				classname = ts._name
+				parent = ts._parent
+				while parent is not None and parent._kind > TestsuiteKind.Logical:
+					classname = f"{parent._name}.{classname}"
+					parent = parent._parent
 
-			if classname in juTestsuite._testclasses:
-				juClass = juTestsuite._testclasses[classname]
-			else:
-				juClass = Testclass(classname, parent=juTestsuite)
+				juClass = juTestsuite._testclasses.get(classname)
+				if juClass is None:
+					juClass = Testclass(classname, parent=juTestsuite)
+
+				testclasses[id(ts)] = juClass
 
 			juClass.AddTestcase(Testcase.FromTestcase(tc))
 
@@ -184,7 +179,7 @@ class TestsuiteSummary(ju_TestsuiteSummary):
 			startTime=testsuiteSummary._startTime,
 			duration=testsuiteSummary._totalDuration,
 			status=testsuiteSummary._status,
-			testsuites=(ut_Testsuite.FromTestsuite(testsuite) for testsuite in testsuiteSummary._testsuites.values())
+			testsuites=(Testsuite.FromTestsuite(testsuite) for testsuite in testsuiteSummary._testsuites.values())
 		)
 
 
@@ -235,6 +230,51 @@ class Document(ju_Document):
 		xmlSchemaFile = "CTest-JUnit.xsd"
 		self._Analyze(xmlSchemaFile)
 
+	def AnalyzeAndConvert(self) -> None:
+		"""
+		Analyze and convert the XML file in a single streaming pass.
+
+		The XML file is validated using an XML schema while it's parsed. In the CTest JUnit dialect, the root element is the
+		only ``<testsuite>`` element. Thus, each ``<testcase>`` element is converted into a test case as soon as it was
+		parsed completely. Afterwards, its XML data structure is released.
+
+		As no XML data structure is kept, :meth:`Write` requires ``regenerate=True`` and writes only what the data model
+		holds. Use :meth:`Analyze` and :meth:`Convert` (the constructor's ``analyzeAndConvert``) to keep the original XML
+		content.
+
+		.. hint::
+
+		   The time spend for parsing, validation and conversion will be made available via property
+		   :data:`AnalysisDuration`. The time spend for aggregation will be made available via property
+		   :data:`ModelConversionDuration`.
+
+		The used XML schema definition is specific to the CTest JUnit dialect.
+		"""
+		xmlSchemaFile = "CTest-JUnit.xsd"
+
+		startAnalysis = perf_counter_ns()
+		testsuite = None
+		for event, element in self._IterParse(xmlSchemaFile, ("testsuite", "testcase")):
+			parentElement = element.getparent()
+			if event == "start":
+				if parentElement is None:
+					self._name = self._ConvertName(element, optional=True)
+					self._startTime = self._ConvertTimestamp(element, optional=True)
+					self._duration = self._ConvertTime(element, optional=True)
+
+					testsuite = Testsuite(self._name, startTime=self._startTime, duration=self._duration, parent=self)
+			elif element.tag == "testcase" and parentElement.getparent() is None:
+				self._ConvertTestcase(testsuite, element)
+				self._ReleaseElement(element)
+
+		endAnalysis = perf_counter_ns()
+		self._analysisDuration = (endAnalysis - startAnalysis) / 1e9
+
+		startConversion = perf_counter_ns()
+		self.Aggregate()
+		endConversation = perf_counter_ns()
+		self._modelConversion = (endConversation - startConversion) / 1e9
+
 	def Write(self, path: Nullable[Path] = None, overwrite: bool = False, regenerate: bool = False) -> None:
 		"""
 		Write the data model as XML into a file adhering to the CTest dialect.
@@ -254,16 +294,20 @@ class Document(ju_Document):
 				from FileExistsError(f"File '{path}' already exists.")
 
 		if regenerate:
-			self.Generate(overwrite=True)
-
-		if self._xmlDocument is None:
+			rootElement = self._GenerateRoot()
+		elif self._xmlDocument is None:
 			ex = UnittestException(f"Internal XML document tree is empty and needs to be generated before write is possible.")
 			ex.add_note(f"Call 'JUnitDocument.Generate()' or 'JUnitDocument.Write(..., regenerate=True)'.")
 			raise ex
+		else:
+			rootElement = None
 
 		try:
 			with path.open("wb") as file:
-				file.write(tostring(self._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True))
+				if rootElement is None:
+					file.write(tostring(self._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True))
+				else:
+					self._WriteIncrementally(file, rootElement)
 		except Exception as ex:
 			raise UnittestException(f"JUnit XML file '{path}' can not be written.") from ex
 
@@ -323,18 +367,12 @@ class Document(ju_Document):
 
 		self._ConvertTestsuiteChildren(testsuitesNode, newTestsuite)
 
-	def Generate(self, overwrite: bool = False) -> None:
+	def _GenerateRoot(self) -> _Element:
 		"""
-		Generate the internal XML data structure from test suites and test cases.
+		Generate the XML root element (``<testsuite>``) without any child elements.
 
-		This method generates the XML root element (``<testsuite>``) and recursively calls other generated methods.
-
-		:param overwrite:          Overwrite the internal XML data structure.
-		:raises UnittestException: If overwrite is false and the internal XML data structure is not empty.
+		:return: The root XML element.
 		"""
-		if not overwrite and self._xmlDocument is not None:
-			raise UnittestException(f"Internal XML document is populated with data.")
-
 		if self.TestsuiteCount != 1:
 			ex = UnittestException(f"The CTest JUnit format requires exactly one test suite.")
 			ex.add_note(f"Found {self.TestsuiteCount} test suites.")
@@ -342,53 +380,74 @@ class Document(ju_Document):
 
 		testsuite = firstValue(self._testsuites)
 
-		rootElement = Element("testsuite")
-		rootElement.attrib["name"] = self._name
+		attributes = {"name": self._name}
 		if self._startTime is not None:
-			rootElement.attrib["timestamp"] = f"{self._startTime.isoformat()}"
+			attributes["timestamp"] = self._GenerateTimestamp(self._startTime)
 		if self._duration is not None:
-			rootElement.attrib["time"] = f"{self._duration.total_seconds():.6f}"
-		rootElement.attrib["tests"] = str(self._tests)
-		rootElement.attrib["failures"] = str(self._failed)
-		# rootElement.attrib["errors"] = str(self._errored)
-		rootElement.attrib["skipped"] = str(self._skipped)
-		rootElement.attrib["disabled"] = "0"                       # TODO: find a value
+			attributes["time"] = self._GenerateTime(self._duration)
+		attributes["tests"] = f"{self._tests}"
+		attributes["failures"] = f"{self._failed}"
+		# attributes["errors"] = f"{self._errored}"
+		attributes["skipped"] = f"{self._skipped}"
+		attributes["disabled"] = "0"                       # TODO: find a value
 		# if self._assertionCount is not None:
-		# 	rootElement.attrib["assertions"] = f"{self._assertionCount}"
-		rootElement.attrib["hostname"] = str(testsuite._hostname)  # TODO: find a value
+		# 	attributes["assertions"] = f"{self._assertionCount}"
+		attributes["hostname"] = str(testsuite._hostname)  # TODO: find a value
+		return Element("testsuite", attributes)
+
+	def _GenerateRootChildren(self, rootElement: _Element) -> None:
+		"""
+		Generate the XML elements below the root element (``<testcase>``).
+
+		:param rootElement: The root XML element, generated elements will be added to.
+		"""
+		testsuite = firstValue(self._testsuites)
+
+		for testclass in testsuite._testclasses.values():
+			for tc in testclass._testcases.values():
+				self._GenerateTestcase(tc, rootElement)
+
+	def _IterateRootChildren(self, rootElement: _Element) -> Generator[_Element, None, None]:
+		"""
+		Generate the XML elements below the root element (``<testcase>``) one at a time.
 
-		self._xmlDocument = ElementTree(rootElement)
+		:param rootElement: The root XML element, generated elements will be added to.
+		:return:            A generator yielding each generated child element after it was added.
+		"""
+		testsuite = firstValue(self._testsuites)
 
 		for testclass in testsuite._testclasses.values():
 			for tc in testclass._testcases.values():
 				self._GenerateTestcase(tc, rootElement)
+				yield rootElement[-1]
 
-	def _GenerateTestcase(self, testcase: Testcase, parentElement: _Element) -> None:
+	def _SerializeRootChildren(self, lines: List[str]) -> None:
 		"""
-		Generate the internal XML data structure for a test case.
+		Format the XML elements below the root element (``<testcase>``) as indented lines of XML text.
+
+		:param lines: The list of lines, formatted lines will be appended to.
+		"""
+		testsuite = firstValue(self._testsuites)
 
-		This method generates the XML element (``<testcase>``) and recursively calls other generated methods.
+		for testclass in testsuite._testclasses.values():
+			for tc in testclass._testcases.values():
+				self._SerializeTestcase(tc, lines, "  ")
+
+	def _GenerateTestcaseAttributes(self, testcase: Testcase) -> Dict[str, str]:
+		"""
+		Generate the XML attributes of a test case element (``<testcase>``).
 
-		:param testcase:      The test case to convert to an XML data structures.
-		:param parentElement: The parent XML data structure element, this data structure part will be added to.
-		:return:
+		:param testcase: The test case to convert to XML attributes.
+		:return:         The XML attributes in order of appearance.
 		"""
-		testcaseElement = SubElement(parentElement, "testcase")
+		attributes = {}
 		if testcase.Classname is not None:
-			testcaseElement.attrib["classname"] = testcase.Classname
-		testcaseElement.attrib["name"] = testcase._name
+			attributes["classname"] = testcase.Classname
+		attributes["name"] = testcase._name
 		if testcase._duration is not None:
-			testcaseElement.attrib["time"] = f"{testcase._duration.total_seconds():.6f}"
+			attributes["time"] = self._GenerateTime(testcase._duration)
 		if testcase._assertionCount is not None:
-			testcaseElement.attrib["assertions"] = f"{testcase._assertionCount}"
-
-		testcaseElement.attrib["status"] = "run"     # TODO: find a value
+			attributes["assertions"] = f"{testcase._assertionCount}"
+		attributes["status"] = "run"     # TODO: find a value
 
-		if testcase._status is TestcaseStatus.Passed:
-			pass
-		elif testcase._status is TestcaseStatus.Failed:
-			failureElement = SubElement(testcaseElement, "failure")
-		elif testcase._status is TestcaseStatus.Skipped:
-			skippedElement = SubElement(testcaseElement, "skipped")
-		else:
-			errorElement = SubElement(testcaseElement, "error")
+		return attributes
@@ -34,13 +34,13 @@ Reader for JUnit unit testing summary files in XML format.
 """
 from pathlib              import Path
 from time                 import perf_counter_ns
-from typing               import Optional as Nullable, Generator, Tuple, Union, TypeVar, Type, ClassVar
+from typing               import Optional as Nullable, Dict, Generator, Tuple, Union, TypeVar, Type, ClassVar
 
-from lxml.etree           import ElementTree, Element, SubElement, tostring, _Element
+from lxml.etree           import Element, tostring, _Element
 from pyTooling.Decorators import export, InheritDocString
 
 from pyEDAA.Reports.Unittesting       import UnittestException, TestsuiteKind
-from pyEDAA.Reports.Unittesting       import TestcaseStatus, TestsuiteStatus, IterationScheme
+from pyEDAA.Reports.Unittesting       import TestcaseStatus, IterationScheme
 from pyEDAA.Reports.Unittesting       import TestsuiteSummary as ut_TestsuiteSummary, Testsuite as ut_Testsuite
 from pyEDAA.Reports.Unittesting.JUnit import Testcase as ju_Testcase, Testclass as ju_Testclass, Testsuite as ju_Testsuite
 from pyEDAA.Reports.Unittesting.JUnit import TestsuiteSummary as ju_TestsuiteSummary, Document as ju_Document
@@ -104,18 +104,7 @@ class Testsuite(ju_Testsuite):
 		self._failed = failed
 		self._passed = passed
 
-		if errored > 0:
-			self._status = TestsuiteStatus.Errored
-		elif failed > 0:
-			self._status = TestsuiteStatus.Failed
-		elif tests == 0:
-			self._status = TestsuiteStatus.Empty
-		elif tests - skipped == passed:
-			self._status = TestsuiteStatus.Passed
-		elif tests == skipped:
-			self._status = TestsuiteStatus.Skipped
-		else:
-			self._status = TestsuiteStatus.Unknown
+		self._status = self._DeriveStatus(tests, skipped, errored, failed, passed)
 
 		return tests, skipped, errored, failed, passed
 
@@ -141,21 +130,27 @@ class Testsuite(ju_Testsuite):
 		juTestsuite._failed = testsuite._failed
 		juTestsuite._passed = testsuite._passed
 
+		# Test classes are memoized per parent test suite (by identity), thus a class path is assembled only once per test
+		# suite instead of once per test case.
+		testclasses: Dict[int, Testclass] = {}
 		for tc in testsuite.IterateTestcases():
 			ts = tc._parent
 			if ts is None:
 				raise UnittestException(f"Testcase '{tc._name}' is not part of a hierarchy.")
 
-			classname = ts._name
-			ts = ts._parent
-			while ts is not None and ts._kind > TestsuiteKind.Logical:
-				classname = f"{ts._name}.{classname}"
-				ts = ts._parent
+			juClass = testclasses.get(id(ts))
+			if juClass is None:
+				classname = ts._name
+				parent = ts._parent
+				while parent is not None and parent._kind > TestsuiteKind.Logical:
+					classname = f"{parent._name}.{classname}"
+					parent = parent._parent
 
-			if classname in juTestsuite._testclasses:
-				juClass = juTestsuite._testclasses[classname]
-			else:
-				juClass = Testclass(classname, parent=juTestsuite)
+				juClass = juTestsuite._testclasses.get(classname)
+				if juClass is None:
+					juClass = Testclass(classname, parent=juTestsuite)
+
+				testclasses[id(ts)] = juClass
 
 			juClass.AddTestcase(Testcase.FromTestcase(tc))
 
@@ -183,7 +178,7 @@ class TestsuiteSummary(ju_TestsuiteSummary):
 			startTime=testsuiteSummary._startTime,
 			duration=testsuiteSummary._totalDuration,
 			status=testsuiteSummary._status,
-			testsuites=(ut_Testsuite.FromTestsuite(testsuite) for testsuite in testsuiteSummary._testsuites.values())
+			testsuites=(Testsuite.FromTestsuite(testsuite) for testsuite in testsuiteSummary._testsuites.values())
 		)
 
 
@@ -234,6 +229,21 @@ class Document(ju_Document):
 		xmlSchemaFile = "GoogleTest-JUnit.xsd"
 		self._Analyze(xmlSchemaFile)
 
+	def AnalyzeAndConvert(self) -> None:
+		"""
+		Analyze and convert the XML file in a single streaming pass.
+
+		.. hint::
+
+		   The time spend for parsing, validation and conversion will be made available via property
+		   :data:`AnalysisDuration`. The time spend for aggregation will be made available via property
+		   :data:`ModelConversionDuration`.
+
+		The used XML schema definition is specific to the GoogleTest JUnit dialect.
+		"""
+		xmlSchemaFile = "GoogleTest-JUnit.xsd"
+		self._AnalyzeAndConvert(xmlSchemaFile)
+
 	def Write(self, path: Nullable[Path] = None, overwrite: bool = False, regenerate: bool = False) -> None:
 		"""
 		Write the data model as XML into a file adhering to the GoogleTest dialect.
@@ -253,16 +263,20 @@ class Document(ju_Document):
 				from FileExistsError(f"File '{path}' already exists.")
 
 		if regenerate:
-			self.Generate(overwrite=True)
-
-		if self._xmlDocument is None:
+			rootElement = self._GenerateRoot()
+		elif self._xmlDocument is None:
 			ex = UnittestException(f"Internal XML document tree is empty and needs to be generated before write is possible.")
 			ex.add_note(f"Call 'JUnitDocument.Generate()' or 'JUnitDocument.Write(..., regenerate=True)'.")
 			raise ex
+		else:
+			rootElement = None
 
 		try:
 			with path.open("wb") as file:
-				file.write(tostring(self._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True))
+				if rootElement is None:
+					file.write(tostring(self._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True))
+				else:
+					self._WriteIncrementally(file, rootElement)
 		except Exception as ex:
 			raise UnittestException(f"JUnit XML file '{path}' can not be written.") from ex
 
@@ -322,97 +336,69 @@ class Document(ju_Document):
 
 		self._ConvertTestsuiteChildren(testsuitesNode, newTestsuite)
 
-	def Generate(self, overwrite: bool = False) -> None:
+	def _GenerateRoot(self) -> _Element:
 		"""
-		Generate the internal XML data structure from test suites and test cases.
-
-		This method generates the XML root element (``<testsuites>``) and recursively calls other generated methods.
+		Generate the XML root element (``<testsuites>``) without any child elements.
 
-		:param overwrite:          Overwrite the internal XML data structure.
-		:raises UnittestException: If overwrite is false and the internal XML data structure is not empty.
+		:return: The root XML element.
 		"""
-		if not overwrite and self._xmlDocument is not None:
-			raise UnittestException(f"Internal XML document is populated with data.")
-
-		rootElement = Element("testsuites")
-		rootElement.attrib["name"] = self._name
+		attributes = {"name": self._name}
 		if self._startTime is not None:
-			rootElement.attrib["timestamp"] = f"{self._startTime.isoformat()}"
+			attributes["timestamp"] = self._GenerateTimestamp(self._startTime)
 		if self._duration is not None:
-			rootElement.attrib["time"] = f"{self._duration.total_seconds():.6f}"
-		rootElement.attrib["tests"] = str(self._tests)
-		rootElement.attrib["failures"] = str(self._failed)
-		rootElement.attrib["errors"] = str(self._errored)
-		# rootElement.attrib["skipped"] = str(self._skipped)
-		rootElement.attrib["disabled"] = "0"                   # TODO: find a value
+			attributes["time"] = self._GenerateTime(self._duration)
+		attributes["tests"] = f"{self._tests}"
+		attributes["failures"] = f"{self._failed}"
+		attributes["errors"] = f"{self._errored}"
+		# attributes["skipped"] = f"{self._skipped}"
+		attributes["disabled"] = "0"                        # TODO: find a value
 		# if self._assertionCount is not None:
-		# 	rootElement.attrib["assertions"] = f"{self._assertionCount}"
+		# 	attributes["assertions"] = f"{self._assertionCount}"
+		return Element("testsuites", attributes)
 
-		self._xmlDocument = ElementTree(rootElement)
-
-		for testsuite in self._testsuites.values():
-			self._GenerateTestsuite(testsuite, rootElement)
-
-	def _GenerateTestsuite(self, testsuite: Testsuite, parentElement: _Element) -> None:
+	def _GenerateTestsuiteAttributes(self, testsuite: Testsuite) -> Dict[str, str]:
 		"""
-		Generate the internal XML data structure for a test suite.
-
-		This method generates the XML element (``<testsuite>``) and recursively calls other generated methods.
+		Generate the XML attributes of a test suite element (``<testsuite>``).
 
-		:param testsuite:     The test suite to convert to an XML data structures.
-		:param parentElement: The parent XML data structure element, this data structure part will be added to.
-		:return:
+		:param testsuite: The test suite to convert to XML attributes.
+		:return:          The XML attributes in order of appearance.
 		"""
-		testsuiteElement = SubElement(parentElement, "testsuite")
-		testsuiteElement.attrib["name"] = testsuite._name
+		attributes = {"name": testsuite._name}
 		if testsuite._startTime is not None:
-			testsuiteElement.attrib["timestamp"] = f"{testsuite._startTime.isoformat()}"
+			attributes["timestamp"] = self._GenerateTimestamp(testsuite._startTime)
 		if testsuite._duration is not None:
-			testsuiteElement.attrib["time"] = f"{testsuite._duration.total_seconds():.6f}"
-		testsuiteElement.attrib["tests"] = str(testsuite._tests)
-		testsuiteElement.attrib["failures"] = str(testsuite._failed)
-		testsuiteElement.attrib["errors"] = str(testsuite._errored)
-		testsuiteElement.attrib["skipped"] = str(testsuite._skipped)
-		testsuiteElement.attrib["disabled"] = "0"                    # TODO: find a value
+			attributes["time"] = self._GenerateTime(testsuite._duration)
+		attributes["tests"] = f"{testsuite._tests}"
+		attributes["failures"] = f"{testsuite._failed}"
+		attributes["errors"] = f"{testsuite._errored}"
+		attributes["skipped"] = f"{testsuite._skipped}"
+		attributes["disabled"] = "0"                        # TODO: find a value
 		# if testsuite._assertionCount is not None:
-		# 	testsuiteElement.attrib["assertions"] = f"{testsuite._assertionCount}"
+		# 	attributes["assertions"] = f"{testsuite._assertionCount}"
 		# if testsuite._hostname is not None:
-		# 	testsuiteElement.attrib["hostname"] = testsuite._hostname
+		# 	attributes["hostname"] = testsuite._hostname
 
-		for testclass in testsuite._testclasses.values():
-			for tc in testclass._testcases.values():
-				self._GenerateTestcase(tc, testsuiteElement)
+		return attributes
 
-	def _GenerateTestcase(self, testcase: Testcase, parentElement: _Element) -> None:
+	def _GenerateTestcaseAttributes(self, testcase: Testcase) -> Dict[str, str]:
 		"""
-		Generate the internal XML data structure for a test case.
+		Generate the XML attributes of a test case element (``<testcase>``).
 
-		This method generates the XML element (``<testcase>``) and recursively calls other generated methods.
-
-		:param testcase:      The test case to convert to an XML data structures.
-		:param parentElement: The parent XML data structure element, this data structure part will be added to.
-		:return:
+		:param testcase: The test case to convert to XML attributes.
+		:return:         The XML attributes in order of appearance.
 		"""
-		testcaseElement = SubElement(parentElement, "testcase")
+		attributes = {}
 		if testcase.Classname is not None:
-			testcaseElement.attrib["classname"] = testcase.Classname
-		testcaseElement.attrib["name"] = testcase._name
+			attributes["classname"] = testcase.Classname
+		attributes["name"] = testcase._name
 		if testcase._duration is not None:
-			testcaseElement.attrib["time"] = f"{testcase._duration.total_seconds():.6f}"
+			attributes["time"] = self._GenerateTime(testcase._duration)
 		if testcase._assertionCount is not None:
-			testcaseElement.attrib["assertions"] = f"{testcase._assertionCount}"
-
-		testcaseElement.attrib["timestamp"] = f"{testcase._parent._parent._startTime.isoformat()}"     # TODO: find a value
-		testcaseElement.attrib["file"] = ""              # TODO: find a value
-		testcaseElement.attrib["line"] = "0"             # TODO: find a value
-		testcaseElement.attrib["status"] = "run"         # TODO: find a value
-		testcaseElement.attrib["result"] = "completed"   # TODO: find a value
-
-		if testcase._status is TestcaseStatus.Passed:
-			pass
-		elif testcase._status is TestcaseStatus.Failed:
-			failureElement = SubElement(testcaseElement, "failure")
-		elif testcase._status is TestcaseStatus.Skipped:
-			skippedElement = SubElement(testcaseElement, "skipped")
-		else:
-			errorElement = SubElement(testcaseElement, "error")
+			attributes["assertions"] = f"{testcase._assertionCount}"
+		attributes["timestamp"] = self._GenerateTimestamp(testcase._parent._parent._startTime)     # TODO: find a value
+		attributes["file"] = ""              # TODO: find a value
+		attributes["line"] = "0"             # TODO: find a value
+		attributes["status"] = "run"         # TODO: find a value
+		attributes["result"] = "completed"   # TODO: find a value
+
+		return attributes
@@ -90,15 +90,18 @@ Ant + JUnit4 XML, a file format specific document is derived from a summary clas
 		 classDef cls fill:#ff9966
 		 classDef case fill:#eeccff
 """
+from copy            import deepcopy
 from datetime        import datetime, timedelta
 from enum            import Flag
+from itertools       import chain
 from pathlib         import Path
 from sys             import version_info
 from time            import perf_counter_ns
-from typing          import Optional as Nullable, Iterable, Dict, Any, Generator, Tuple, Union, TypeVar, Type, ClassVar
+from typing          import Optional as Nullable, Iterable, Dict, Any, Generator, Tuple, Union, TypeVar, Type, ClassVar, BinaryIO, List
 
-from lxml.etree                 import XMLParser, parse, XMLSchema, ElementTree, Element, SubElement, tostring
-from lxml.etree                 import XMLSyntaxError, _ElementTree, _Element, _Comment, XMLSchemaParseError
+from lxml.etree                 import XMLParser, parse, iterparse, XMLSchema, ElementTree, Element, SubElement, tostring
+from lxml.etree                 import indent
+from lxml.etree                 import XMLSyntaxError, _ElementTree, _Element, XMLSchemaParseError
 from pyTooling.Common           import getFullyQualifiedName, getResourceFile
 from pyTooling.Decorators       import export, readonly
 from pyTooling.Exceptions       import ToolingException
@@ -245,7 +248,7 @@ class BaseWithProperties(Base):
 
 	_duration:       Nullable[timedelta]
 	_assertionCount: Nullable[int]
-	_properties:     Dict[str, Any]
+	_properties:     Nullable[Dict[str, Any]]  #: Properties, allocated on first use.
 
 	def __init__(
 		self,
@@ -281,7 +284,7 @@ class BaseWithProperties(Base):
 		self._duration = duration
 		self._assertionCount = assertionCount
 
-		self._properties = {}
+		self._properties = None
 
 	@readonly
 	def Duration(self) -> timedelta:
@@ -317,6 +320,9 @@ class BaseWithProperties(Base):
 
 		:return: Number of annotated properties.
 		"""
+		if self._properties is None:
+			return 0
+
 		return len(self._properties)
 
 	def __getitem__(self, name: str) -> Any:
@@ -328,6 +334,9 @@ class BaseWithProperties(Base):
 		:param name: Name if the property.
 		:return:     Value of the accessed property.
 		"""
+		if self._properties is None:
+			raise KeyError(name)
+
 		return self._properties[name]
 
 	def __setitem__(self, name: str, value: Any) -> None:
@@ -341,7 +350,10 @@ class BaseWithProperties(Base):
 		:param name:  Name of the property.
 		:param value: Value of the property.
 		"""
-		self._properties[name] = value
+		if self._properties is None:
+			self._properties = {name: value}
+		else:
+			self._properties[name] = value
 
 	def __delitem__(self, name: str) -> None:
 		"""
@@ -351,7 +363,12 @@ class BaseWithProperties(Base):
 
 		:param name: Name if the property.
 		"""
+		if self._properties is None:
+			raise KeyError(name)
+
 		del self._properties[name]
+		if len(self._properties) == 0:
+			self._properties = None
 
 	def __contains__(self, name: str) -> bool:
 		"""
@@ -362,7 +379,7 @@ class BaseWithProperties(Base):
 		:param name: Name of the property.
 		:return:     True, if the property was annotated.
 		"""
-		return name in self._properties
+		return self._properties is not None and name in self._properties
 
 	def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
 		"""
@@ -372,7 +389,8 @@ class BaseWithProperties(Base):
 
 		:return: A generator of property tuples (name, value).
 		"""
-		yield from self._properties.items()
+		if self._properties is not None:
+			yield from self._properties.items()
 
 
 @export
@@ -426,6 +444,41 @@ class Testcase(BaseWithProperties):
 
 		self._status = status
 
+	@classmethod
+	def _FromConversion(
+		cls,
+		name: str,
+		duration: Nullable[timedelta],
+		assertionCount: Nullable[int],
+		parent: "Testclass"
+	) -> "Testcase":
+		"""
+		Create a test case from converted XML attributes.
+
+		This is a fast path for document readers. The attribute converters already guarantee the parameter types and the
+		parent is a test class looked up or created by the reader, thus the type checks of :meth:`__init__` are skipped.
+
+		:param name:           Name of the test entity.
+		:param duration:       Duration of the entity's execution.
+		:param assertionCount: Number of assertions within the test.
+		:param parent:         Reference to the parent test class.
+		:return:               The new test case with status :attr:`TestcaseStatus.Unknown`.
+		:raises ValueError:    If parameter 'name' is empty.
+		"""
+		if name.strip() == "":
+			raise ValueError(f"Parameter 'name' is empty.")
+
+		testcase = cls.__new__(cls)
+		testcase._parent = parent
+		testcase._name = name
+		testcase._duration = duration
+		testcase._assertionCount = assertionCount
+		testcase._properties = None
+		testcase._status = TestcaseStatus.Unknown
+
+		parent._testcases[name] = testcase
+		return testcase
+
 	@readonly
 	def Classname(self) -> str:
 		"""
@@ -635,6 +688,31 @@ class TestsuiteBase(BaseWithProperties):
 
 		return tests, skipped, errored, failed, passed
 
+	@staticmethod
+	def _DeriveStatus(tests: int, skipped: int, errored: int, failed: int, passed: int) -> TestsuiteStatus:
+		"""
+		Derive the overall status of a test suite or test summary from its aggregated counters.
+
+		:param tests:   Number of tests.
+		:param skipped: Number of skipped tests.
+		:param errored: Number of errored tests.
+		:param failed:  Number of failed tests.
+		:param passed:  Number of passed tests.
+		:return:        The derived status.
+		"""
+		if errored > 0:
+			return TestsuiteStatus.Errored
+		elif failed > 0:
+			return TestsuiteStatus.Failed
+		elif tests == 0:
+			return TestsuiteStatus.Empty
+		elif tests - skipped == passed:
+			return TestsuiteStatus.Passed
+		elif tests == skipped:
+			return TestsuiteStatus.Skipped
+		else:
+			return TestsuiteStatus.Unknown
+
 	@mustoverride
 	def Iterate(self, scheme: IterationScheme = IterationScheme.Default) -> Generator[Union[TestsuiteType, Testcase], None, None]:
 		pass
@@ -688,6 +766,30 @@ class Testclass(Base):
 				testcase._parent = self
 				self._testcases[testcase._name] = testcase
 
+	@classmethod
+	def _FromConversion(cls, classname: str, parent: "Testsuite") -> "Testclass":
+		"""
+		Create an empty test class from a converted XML attribute.
+
+		This is a fast path for document readers. The parent is a test suite created by the reader, thus the type checks of
+		:meth:`__init__` are skipped.
+
+		:param classname:   Classname of the test entity.
+		:param parent:      Reference to the parent test suite.
+		:return:            The new test class.
+		:raises ValueError: If parameter 'classname' is empty.
+		"""
+		if classname.strip() == "":
+			raise ValueError(f"Parameter 'classname' is empty.")
+
+		testclass = cls.__new__(cls)
+		testclass._parent = parent
+		testclass._name = classname
+		testclass._testcases = {}
+
+		parent._testclasses[classname] = testclass
+		return testclass
+
 	@readonly
 	def Classname(self) -> str:
 		"""
@@ -901,18 +1003,7 @@ class Testsuite(TestsuiteBase):
 		self._failed = failed
 		self._passed = passed
 
-		if errored > 0:
-			self._status = TestsuiteStatus.Errored
-		elif failed > 0:
-			self._status = TestsuiteStatus.Failed
-		elif tests == 0:
-			self._status = TestsuiteStatus.Empty
-		elif tests - skipped == passed:
-			self._status = TestsuiteStatus.Passed
-		elif tests == skipped:
-			self._status = TestsuiteStatus.Skipped
-		else:
-			self._status = TestsuiteStatus.Unknown
+		self._status = self._DeriveStatus(tests, skipped, errored, failed, passed)
 
 		return tests, skipped, errored, failed, passed
 
@@ -927,24 +1018,17 @@ class Testsuite(TestsuiteBase):
 		"""
 		assert IterationScheme.PreOrder | IterationScheme.PostOrder not in scheme
 
-		if IterationScheme.PreOrder in scheme:
-			if IterationScheme.IncludeSelf | IterationScheme.IncludeTestsuites in scheme:
-				yield self
+		includeSelf = IterationScheme.IncludeSelf | IterationScheme.IncludeTestsuites in scheme
 
-			if IterationScheme.IncludeTestcases in scheme:
-				for testcase in self._testclasses.values():
-					yield testcase
-
-		for testclass in self._testclasses.values():
-			yield from testclass.Iterate(scheme | IterationScheme.IncludeSelf)
+		if includeSelf and IterationScheme.PreOrder in scheme:
+			yield self
 
-		if IterationScheme.PostOrder in scheme:
-			if IterationScheme.IncludeTestcases in scheme:
-				for testcase in self._testclasses.values():
-					yield testcase
+		if IterationScheme.IncludeTestcases in scheme:
+			for testclass in self._testclasses.values():
+				yield from testclass._testcases.values()
 
-			if IterationScheme.IncludeSelf | IterationScheme.IncludeTestsuites in scheme:
-				yield self
+		if includeSelf and IterationScheme.PostOrder in scheme:
+			yield self
 
 	@classmethod
 	def FromTestsuite(cls, testsuite: ut_Testsuite) -> "Testsuite":
@@ -967,21 +1051,27 @@ class Testsuite(TestsuiteBase):
 		juTestsuite._failed = testsuite._failed
 		juTestsuite._passed = testsuite._passed
 
+		# Test classes are memoized per parent test suite (by identity), thus a class path is assembled only once per test
+		# suite instead of once per test case.
+		testclasses: Dict[int, Testclass] = {}
 		for tc in testsuite.IterateTestcases():
 			ts = tc._parent
 			if ts is None:
 				raise UnittestException(f"Testcase '{tc._name}' is not part of a hierarchy.")
 
-			classname = ts._name
-			ts = ts._parent
-			while ts is not None and ts._kind > TestsuiteKind.Logical:
-				classname = f"{ts._name}.{classname}"
-				ts = ts._parent
+			juClass = testclasses.get(id(ts))
+			if juClass is None:
+				classname = ts._name
+				parent = ts._parent
+				while parent is not None and parent._kind > TestsuiteKind.Logical:
+					classname = f"{parent._name}.{classname}"
+					parent = parent._parent
 
-			if classname in juTestsuite._testclasses:
-				juClass = juTestsuite._testclasses[classname]
-			else:
-				juClass = Testclass(classname, parent=juTestsuite)
+				juClass = juTestsuite._testclasses.get(classname)
+				if juClass is None:
+					juClass = Testclass(classname, parent=juTestsuite)
+
+				testclasses[id(ts)] = juClass
 
 			juClass.AddTestcase(Testcase.FromTestcase(tc))
 
@@ -996,14 +1086,26 @@ class Testsuite(TestsuiteBase):
 			status=self._status,
 		)
 
+		# Maps dotted class paths (and their prefixes) to already created test suites. Thus, test classes sharing a package or
+		# module path find their parent test suite with a single lookup and only the missing suffix is created.
+		testsuites: Dict[str, ut_Testsuite] = {}
 		for testclass in self._testclasses.values():
-			suite = testsuite
-			classpath = testclass._name.split(".")
-			for element in classpath:
-				if element in suite._testsuites:
-					suite = suite._testsuites[element]
-				else:
-					suite = ut_Testsuite(element, kind=TestsuiteKind.Package, parent=suite)
+			classpath = testclass._name
+			suite = testsuites.get(classpath)
+			if suite is None:
+				missing = []
+				path = classpath
+				while suite is None:
+					parentPath, separator, element = path.rpartition(".")
+					missing.append((path, element))
+					if separator == "":
+						suite = testsuite
+					else:
+						path = parentPath
+						suite = testsuites.get(path)
+
+				for path, element in reversed(missing):
+					suite = testsuites[path] = ut_Testsuite(element, kind=TestsuiteKind.Package, parent=suite)
 
 			suite._kind = TestsuiteKind.Class
 			if suite._parent is not testsuite:
@@ -1073,19 +1175,35 @@ class TestsuiteSummary(TestsuiteBase):
 	def AssertionCount(self) -> int:
 		return sum(ts.AssertionCount for ts in self._testsuites.values())
 
-	def AddTestsuite(self, testsuite: Testsuite) -> None:
+	def _CheckTestsuite(self, testsuite: Testsuite, newTestsuites: Nullable[Dict[str, Testsuite]] = None) -> None:
+		if not isinstance(testsuite, Testsuite):
+			ex = TypeError(f"Parameter 'testsuite' is not of type 'Testsuite'.")
+			if version_info >= (3, 11):  # pragma: no cover
+				ex.add_note(f"Got type '{getFullyQualifiedName(testsuite)}'.")
+			raise ex
+
 		if testsuite._parent is not None:
 			raise ValueError(f"Testsuite '{testsuite._name}' is already part of a testsuite hierarchy.")
 
-		if testsuite._name in self._testsuites:
+		if testsuite._name in self._testsuites or (newTestsuites is not None and testsuite._name in newTestsuites):
 			raise DuplicateTestsuiteException(f"Testsuite already contains a testsuite with same name '{testsuite._name}'.")
 
+	def AddTestsuite(self, testsuite: Testsuite) -> None:
+		self._CheckTestsuite(testsuite)
+
 		testsuite._parent = self
 		self._testsuites[testsuite._name] = testsuite
 
 	def AddTestsuites(self, testsuites: Iterable[Testsuite]) -> None:
+		newTestsuites = {}
 		for testsuite in testsuites:
-			self.AddTestsuite(testsuite)
+			self._CheckTestsuite(testsuite, newTestsuites)
+			newTestsuites[testsuite._name] = testsuite
+
+		for testsuite in newTestsuites.values():
+			testsuite._parent = self
+
+		self._testsuites.update(newTestsuites)
 
 	def Aggregate(self) -> TestsuiteAggregateReturnType:
 		tests, skipped, errored, failed, passed = super().Aggregate()
@@ -1096,18 +1214,7 @@ class TestsuiteSummary(TestsuiteBase):
 		self._failed = failed
 		self._passed = passed
 
-		if errored > 0:
-			self._status = TestsuiteStatus.Errored
-		elif failed > 0:
-			self._status = TestsuiteStatus.Failed
-		elif tests == 0:
-			self._status = TestsuiteStatus.Empty
-		elif tests - skipped == passed:
-			self._status = TestsuiteStatus.Passed
-		elif tests == skipped:
-			self._status = TestsuiteStatus.Skipped
-		else:
-			self._status = TestsuiteStatus.Unknown
+		self._status = self._DeriveStatus(tests, skipped, errored, failed, passed)
 
 		return tests, skipped, errored, failed, passed
 
@@ -1120,13 +1227,16 @@ class TestsuiteSummary(TestsuiteBase):
 		:param scheme: Scheme how to iterate the test suite summary and its child elements.
 		:returns:      A generator for iterating the results filtered and in the order defined by the iteration scheme.
 		"""
-		if IterationScheme.IncludeSelf | IterationScheme.IncludeTestsuites | IterationScheme.PreOrder in scheme:
+		includeSelf = IterationScheme.IncludeSelf | IterationScheme.IncludeTestsuites in scheme
+		testsuiteScheme = scheme | IterationScheme.IncludeSelf
+
+		if includeSelf and IterationScheme.PreOrder in scheme:
 			yield self
 
 		for testsuite in self._testsuites.values():
-			yield from testsuite.IterateTestsuites(scheme | IterationScheme.IncludeSelf)
+			yield from testsuite.Iterate(testsuiteScheme)
 
-		if IterationScheme.IncludeSelf | IterationScheme.IncludeTestsuites | IterationScheme.PostOrder in scheme:
+		if includeSelf and IterationScheme.PostOrder in scheme:
 			yield self
 
 	@classmethod
@@ -1142,7 +1252,7 @@ class TestsuiteSummary(TestsuiteBase):
 			startTime=testsuiteSummary._startTime,
 			duration=testsuiteSummary._totalDuration,
 			status=testsuiteSummary._status,
-			testsuites=(ut_Testsuite.FromTestsuite(testsuite) for testsuite in testsuiteSummary._testsuites.values())
+			testsuites=(Testsuite.FromTestsuite(testsuite) for testsuite in testsuiteSummary._testsuites.values())
 		)
 
 	def ToTestsuiteSummary(self) -> ut_TestsuiteSummary:
@@ -1184,15 +1294,38 @@ class Document(TestsuiteSummary, ut_Document):
 	_TESTCASE:          ClassVar[Type[Testcase]] =         Testcase
 	_TESTCLASS:         ClassVar[Type[Testclass]] =        Testclass
 	_TESTSUITE:         ClassVar[Type[Testsuite]] =        Testsuite
+	_STATUS_TAGS:       ClassVar[Dict[str, TestcaseStatus]] = {
+		"skipped": TestcaseStatus.Skipped,
+		"failure": TestcaseStatus.Failed,
+		"error":   TestcaseStatus.Errored
+	}
+	_IGNORED_TAGS:      ClassVar[Tuple[str, ...]] = ("system-out", "system-err", "properties")  #: Test case child elements not converted.
+	_STATUS_ELEMENTS:   ClassVar[Dict[TestcaseStatus, str]] = {
+		TestcaseStatus.Failed:  "failure",
+		TestcaseStatus.Skipped: "skipped"
+	}  #: Status child element of a generated test case; passed test cases have none, all other states map to ``<error>``.
+	_ATTRIBUTE_ESCAPES: ClassVar[Dict[int, str]] = str.maketrans({
+		"&":  "&amp;",
+		"<":  "&lt;",
+		">":  "&gt;",
+		"\"": "&quot;",
+		"\n": "&#10;",
+		"\r": "&#13;",
+		"\t": "&#9;"
+	})  #: Character references used by lxml when serializing attribute values.
+	_SCHEMAS:           ClassVar[Dict[str, Tuple[Path, XMLSchema]]] = {}   #: Resolved paths and compiled XML schemas shared by all documents, indexed by filename.
+	_NO_TIMESTAMP:      ClassVar[object] = object()           #: Marks the empty timestamp cache, because ``None`` might be passed as timestamp.
 
 	_readerMode:        JUnitReaderMode
 	_xmlDocument:       Nullable[_ElementTree]
+	_timestamp:         Tuple[Union[datetime, object], str]  #: Last generated ``timestamp`` attribute, because test cases often share the same timestamp object.
 
 	def __init__(self, xmlReportFile: Path, analyzeAndConvert: bool = False, readerMode: JUnitReaderMode = JUnitReaderMode.Default):
 		super().__init__("Unprocessed JUnit XML file")
 
 		self._readerMode = readerMode
 		self._xmlDocument = None
+		self._timestamp = (self._NO_TIMESTAMP, "")
 
 		ut_Document.__init__(self, xmlReportFile, analyzeAndConvert)
 
@@ -1233,6 +1366,40 @@ class Document(TestsuiteSummary, ut_Document):
 				from FileNotFoundError(f"File '{self._path}' not found.")
 
 		startAnalysis = perf_counter_ns()
+		xmlSchemaResourceFile, junitSchema = self._LoadSchema(xmlSchemaFile)
+
+		try:
+			junitParser = XMLParser(schema=junitSchema, ns_clean=True)
+			junitDocument = parse(self._path, parser=junitParser)
+
+			self._xmlDocument = junitDocument
+		except XMLSyntaxError as ex:
+			if version_info >= (3, 11):  # pragma: no cover
+				for logEntry in junitParser.error_log:
+					ex.add_note(str(logEntry))
+			raise UnittestException(f"XML syntax or validation error for '{self._path}' using XSD schema '{xmlSchemaResourceFile}'.") from ex
+		except Exception as ex:
+			raise UnittestException(f"Couldn't open '{self._path}'.") from ex
+
+		endAnalysis = perf_counter_ns()
+		self._analysisDuration = (endAnalysis - startAnalysis) / 1e9
+
+	def _LoadSchema(self, xmlSchemaFile: str) -> Tuple[Path, XMLSchema]:
+		"""
+		Load an XML schema definition from the package's resources.
+
+		A compiled XML schema is cached together with its resolved path, so it's located, parsed and compiled only once per
+		process.
+
+		:param xmlSchemaFile:      Filename of the XML schema definition.
+		:return:                   A tuple of the resolved path to the XML schema definition and the parsed XML schema.
+		:raises UnittestException: If the XML schema definition can't be located or parsed.
+		"""
+		try:
+			return self._SCHEMAS[xmlSchemaFile]
+		except KeyError:
+			pass
+
 		try:
 			xmlSchemaResourceFile = getResourceFile(Resources, xmlSchemaFile)
 		except ToolingException as ex:
@@ -1249,21 +1416,97 @@ class Document(TestsuiteSummary, ut_Document):
 		except XMLSchemaParseError as ex:
 			raise UnittestException(f"Error while parsing XML Schema '{xmlSchemaFile}'.")
 
+		self._SCHEMAS[xmlSchemaFile] = xmlSchemaResourceFile, junitSchema
+		return xmlSchemaResourceFile, junitSchema
+
+	def AnalyzeAndConvert(self) -> None:
+		"""
+		Analyze and convert the XML file in a single streaming pass.
+
+		The XML file is validated using an XML schema while it's parsed. Each ``<testsuite>`` element is converted into a
+		test suite as soon as it was parsed completely. Afterwards, its XML data structure is released, thus the XML document
+		is never held in memory as a whole.
+
+		As no XML data structure is kept, :meth:`Write` requires ``regenerate=True`` and writes only what the data model
+		holds (e.g. no failure messages). Use :meth:`Analyze` and :meth:`Convert` (the constructor's ``analyzeAndConvert``)
+		to keep the original XML content.
+
+		.. hint::
+
+		   The time spend for parsing, validation and conversion will be made available via property
+		   :data:`AnalysisDuration`. The time spend for aggregation will be made available via property
+		   :data:`ModelConversionDuration`.
+
+		The used XML schema definition is generic to support "any" dialect.
+		"""
+		xmlSchemaFile = "Any-JUnit.xsd"
+		self._AnalyzeAndConvert(xmlSchemaFile)
+
+	def _AnalyzeAndConvert(self, xmlSchemaFile: str) -> None:
+		startAnalysis = perf_counter_ns()
+		for event, element in self._IterParse(xmlSchemaFile, ("testsuites", "testsuite")):
+			parentElement = element.getparent()
+			if event == "start":
+				# Attributes are available on start events, but children might be incomplete.
+				if parentElement is None:
+					self._name = self._ConvertName(element, optional=True)
+					self._startTime = self._ConvertTimestamp(element, optional=True)
+					self._duration = self._ConvertTime(element, optional=True)
+			elif parentElement is not None and parentElement.getparent() is None:
+				self._ConvertTestsuite(self, element)
+				self._ReleaseElement(element)
+
+		endAnalysis = perf_counter_ns()
+		self._analysisDuration = (endAnalysis - startAnalysis) / 1e9
+
+		startConversion = perf_counter_ns()
+		self.Aggregate()
+
+		endConversation = perf_counter_ns()
+		self._modelConversion = (endConversation - startConversion) / 1e9
+
+	def _IterParse(self, xmlSchemaFile: str, tags: Tuple[str, ...]) -> Generator[Tuple[str, _Element], None, None]:
+		"""
+		Parse and validate the XML file incrementally.
+
+		:param xmlSchemaFile:      Filename of the XML schema definition used for validation.
+		:param tags:               XML element names to report.
+		:return:                   A generator of ``start`` and ``end`` events as tuples (event, element).
+		:raises UnittestException: If the file doesn't exist or can't be opened.
+		:raises UnittestException: If the XML file contains syntax errors or doesn't validate against the XML schema.
+		"""
+		if not self._path.exists():
+			raise UnittestException(f"JUnit XML file '{self._path}' does not exist.") \
+				from FileNotFoundError(f"File '{self._path}' not found.")
+
+		xmlSchemaResourceFile, junitSchema = self._LoadSchema(xmlSchemaFile)
+
 		try:
-			junitParser = XMLParser(schema=junitSchema, ns_clean=True)
-			junitDocument = parse(self._path, parser=junitParser)
+			events = iterparse(str(self._path), events=("start", "end"), tag=tags, schema=junitSchema)
+		except OSError as ex:
+			raise UnittestException(f"Couldn't open '{self._path}'.") from ex
 
-			self._xmlDocument = junitDocument
+		try:
+			yield from events
 		except XMLSyntaxError as ex:
 			if version_info >= (3, 11):  # pragma: no cover
-				for logEntry in junitParser.error_log:
+				for logEntry in events.error_log:
 					ex.add_note(str(logEntry))
 			raise UnittestException(f"XML syntax or validation error for '{self._path}' using XSD schema '{xmlSchemaResourceFile}'.") from ex
-		except Exception as ex:
+		except OSError as ex:
 			raise UnittestException(f"Couldn't open '{self._path}'.") from ex
 
-		endAnalysis = perf_counter_ns()
-		self._analysisDuration = (endAnalysis - startAnalysis) / 1e9
+	@staticmethod
+	def _ReleaseElement(element: _Element) -> None:
+		"""
+		Release an already converted XML element as well as all preceding siblings (e.g. comments).
+
+		:param element: The converted XML element.
+		"""
+		element.clear()
+		parentElement = element.getparent()
+		while element.getprevious() is not None:
+			del parentElement[0]
 
 	def Write(self, path: Nullable[Path] = None, overwrite: bool = False, regenerate: bool = False) -> None:
 		"""
@@ -1284,16 +1527,55 @@ class Document(TestsuiteSummary, ut_Document):
 				from FileExistsError(f"File '{path}' already exists.")
 
 		if regenerate:
-			self.Generate(overwrite=True)
-
-		if self._xmlDocument is None:
+			rootElement = self._GenerateRoot()
+		elif self._xmlDocument is None:
 			ex = UnittestException(f"Internal XML document tree is empty and needs to be generated before write is possible.")
 			ex.add_note(f"Call 'JUnitDocument.Generate()' or 'JUnitDocument.Write(..., regenerate=True)'.")
 			raise ex
+		else:
+			rootElement = None
 
 		try:
 			with path.open("wb") as file:
-				file.write(tostring(self._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True))
+				if rootElement is None:
+					file.write(tostring(self._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True))
+				else:
+					self._WriteIncrementally(file, rootElement)
+		except Exception as ex:
+			raise UnittestException(f"JUnit XML file '{path}' can not be written.") from ex
+
+	def WriteFast(self, path: Nullable[Path] = None, overwrite: bool = False) -> None:
+		"""
+		Write the data model as XML into a file by formatting the XML text directly.
+
+		No XML data structure is generated, thus the data model is not checked by lxml (e.g. for characters not allowed in
+		XML). The written file is identical to the result of :meth:`Write` with ``regenerate=True``.
+
+		:param path:               Optional path to the XMl file, if internal path shouldn't be used.
+		:param overwrite:          If true, overwrite an existing file.
+		:raises UnittestException: If the file cannot be overwritten.
+		:raises UnittestException: If the file cannot be opened or written.
+		"""
+		if path is None:
+			path = self._path
+
+		if not overwrite and path.exists():
+			raise UnittestException(f"JUnit XML file '{path}' can not be overwritten.") \
+				from FileExistsError(f"File '{path}' already exists.")
+
+		rootElement = self._GenerateRoot()
+		lines = ["<?xml version='1.0' encoding='utf-8'?>", self._SerializeStartTag(rootElement.tag, rootElement.attrib)]
+		self._SerializeRootChildren(lines)
+		if len(lines) == 2:
+			lines[1] += "/>"
+		else:
+			lines[1] += ">"
+			lines.append(f"</{rootElement.tag}>")
+		lines.append("")
+
+		try:
+			with path.open("wb") as file:
+				file.write("\n".join(lines).encode("utf-8"))
 		except Exception as ex:
 			raise UnittestException(f"JUnit XML file '{path}' can not be written.") from ex
 
@@ -1347,8 +1629,9 @@ class Document(TestsuiteSummary, ut_Document):
 		:return:                   The ``name`` attribute's content if found, otherwise the given default value.
 		:raises UnittestException: If optional is false and no ``name`` attribute exists on the given element node.
 		"""
-		if "name" in element.attrib:
-			return element.attrib["name"]
+		name = element.get("name")
+		if name is not None:
+			return name
 		elif not optional:
 			raise UnittestException(f"Required parameter 'name' not found in tag '{element.tag}'.")
 		else:
@@ -1363,8 +1646,8 @@ class Document(TestsuiteSummary, ut_Document):
 		:return:                   The ``timestamp`` attribute's content if found, otherwise ``None``.
 		:raises UnittestException: If optional is false and no ``timestamp`` attribute exists on the given element node.
 		"""
-		if "timestamp" in element.attrib:
-			timestamp = element.attrib["timestamp"]
+		timestamp = element.get("timestamp")
+		if timestamp is not None:
 			return datetime.fromisoformat(timestamp)
 		elif not optional:
 			raise UnittestException(f"Required parameter 'timestamp' not found in tag '{element.tag}'.")
@@ -1380,8 +1663,8 @@ class Document(TestsuiteSummary, ut_Document):
 		:return:                   The ``time`` attribute's content if found, otherwise ``None``.
 		:raises UnittestException: If optional is false and no ``time`` attribute exists on the given element node.
 		"""
-		if "time" in element.attrib:
-			time = element.attrib["time"]
+		time = element.get("time")
+		if time is not None:
 			return timedelta(seconds=float(time))
 		elif not optional:
 			raise UnittestException(f"Required parameter 'time' not found in tag '{element.tag}'.")
@@ -1398,8 +1681,9 @@ class Document(TestsuiteSummary, ut_Document):
 		:return:                   The ``hostname`` attribute's content if found, otherwise the given default value.
 		:raises UnittestException: If optional is false and no ``hostname`` attribute exists on the given element node.
 		"""
-		if "hostname" in element.attrib:
-			return element.attrib["hostname"]
+		hostname = element.get("hostname")
+		if hostname is not None:
+			return hostname
 		elif not optional:
 			raise UnittestException(f"Required parameter 'hostname' not found in tag '{element.tag}'.")
 		else:
@@ -1413,8 +1697,9 @@ class Document(TestsuiteSummary, ut_Document):
 		:return:                   The ``classname`` attribute's content.
 		:raises UnittestException: If no ``classname`` attribute exists on the given element node.
 		"""
-		if "classname" in element.attrib:
-			return element.attrib["classname"]
+		classname = element.get("classname")
+		if classname is not None:
+			return classname
 		else:
 			raise UnittestException(f"Required parameter 'classname' not found in tag '{element.tag}'.")
 
@@ -1428,8 +1713,9 @@ class Document(TestsuiteSummary, ut_Document):
 		:return:                   The ``tests`` attribute's content if found, otherwise the given default value.
 		:raises UnittestException: If optional is false and no ``tests`` attribute exists on the given element node.
 		"""
-		if "tests" in element.attrib:
-			return int(element.attrib["tests"])
+		tests = element.get("tests")
+		if tests is not None:
+			return int(tests)
 		elif not optional:
 			raise UnittestException(f"Required parameter 'tests' not found in tag '{element.tag}'.")
 		else:
@@ -1445,8 +1731,9 @@ class Document(TestsuiteSummary, ut_Document):
 		:return:                   The ``skipped`` attribute's content if found, otherwise the given default value.
 		:raises UnittestException: If optional is false and no ``skipped`` attribute exists on the given element node.
 		"""
-		if "skipped" in element.attrib:
-			return int(element.attrib["skipped"])
+		skipped = element.get("skipped")
+		if skipped is not None:
+			return int(skipped)
 		elif not optional:
 			raise UnittestException(f"Required parameter 'skipped' not found in tag '{element.tag}'.")
 		else:
@@ -1462,8 +1749,9 @@ class Document(TestsuiteSummary, ut_Document):
 		:return:                   The ``errors`` attribute's content if found, otherwise the given default value.
 		:raises UnittestException: If optional is false and no ``errors`` attribute exists on the given element node.
 		"""
-		if "errors" in element.attrib:
-			return int(element.attrib["errors"])
+		errors = element.get("errors")
+		if errors is not None:
+			return int(errors)
 		elif not optional:
 			raise UnittestException(f"Required parameter 'errors' not found in tag '{element.tag}'.")
 		else:
@@ -1479,8 +1767,9 @@ class Document(TestsuiteSummary, ut_Document):
 		:return:                   The ``failures`` attribute's content if found, otherwise the given default value.
 		:raises UnittestException: If optional is false and no ``failures`` attribute exists on the given element node.
 		"""
-		if "failures" in element.attrib:
-			return int(element.attrib["failures"])
+		failures = element.get("failures")
+		if failures is not None:
+			return int(failures)
 		elif not optional:
 			raise UnittestException(f"Required parameter 'failures' not found in tag '{element.tag}'.")
 		else:
@@ -1496,8 +1785,9 @@ class Document(TestsuiteSummary, ut_Document):
 		:return:                   The ``assertions`` attribute's content if found, otherwise the given default value.
 		:raises UnittestException: If optional is false and no ``assertions`` attribute exists on the given element node.
 		"""
-		if "assertions" in element.attrib:
-			return int(element.attrib["assertions"])
+		assertions = element.get("assertions")
+		if assertions is not None:
+			return int(assertions)
 		elif not optional:
 			raise UnittestException(f"Required parameter 'assertions' not found in tag '{element.tag}'.")
 		else:
@@ -1530,12 +1820,8 @@ class Document(TestsuiteSummary, ut_Document):
 		self._ConvertTestsuiteChildren(testsuitesNode, newTestsuite)
 
 	def _ConvertTestsuiteChildren(self, testsuitesNode: _Element, newTestsuite: Testsuite) -> None:
-		for node in testsuitesNode.iterchildren():   # type: _Element
-			# if node.tag == "testsuite":
-			# 	self._ConvertTestsuite(newTestsuite, node)
-			# el
-			if node.tag == "testcase":
-				self._ConvertTestcase(newTestsuite, node)
+		for node in testsuitesNode.iterchildren(tag="testcase"):   # type: _Element
+			self._ConvertTestcase(newTestsuite, node)
 
 	def _ConvertTestcase(self, parent: Testsuite, testcaseNode: _Element) -> None:
 		"""
@@ -1549,46 +1835,61 @@ class Document(TestsuiteSummary, ut_Document):
 		className = self._ConvertClassname(testcaseNode)
 		testclass = self._FindOrCreateTestclass(parent, className)
 
-		newTestcase = self._TESTCASE(
+		newTestcase = self._TESTCASE._FromConversion(
 			self._ConvertName(testcaseNode, optional=False),
 			self._ConvertTime(testcaseNode, optional=False),
-			assertionCount=self._ConvertAssertions(testcaseNode),
-			parent=testclass
+			self._ConvertAssertions(testcaseNode),
+			testclass
 		)
 
 		self._ConvertTestcaseChildren(testcaseNode, newTestcase)
 
 	def _FindOrCreateTestclass(self, parent: Testsuite, className: str) -> Testclass:
-		if className in parent._testclasses:
-			return parent._testclasses[className]
-		else:
-			return self._TESTCLASS(className, parent=parent)
+		testclass = parent._testclasses.get(className)
+		if testclass is None:
+			testclass = self._TESTCLASS._FromConversion(className, parent)
+
+		return testclass
 
 	def _ConvertTestcaseChildren(self, testcaseNode: _Element, newTestcase: Testcase) -> None:
-		for node in testcaseNode.iterchildren():   # type: _Element
-			if isinstance(node, _Comment):
-				pass
-			elif isinstance(node, _Element):
-				if node.tag == "skipped":
-					newTestcase._status = TestcaseStatus.Skipped
-				elif node.tag == "failure":
-					newTestcase._status = TestcaseStatus.Failed
-				elif node.tag == "error":
-					newTestcase._status = TestcaseStatus.Errored
-				elif node.tag == "system-out":
-					pass
-				elif node.tag == "system-err":
-					pass
-				elif node.tag == "properties":
-					pass
-				else:
-					raise UnittestException(f"Unknown element '{node.tag}' in junit file.")
-			else:
-				pass
+		# Comments and processing instructions are skipped by lxml's tag filter. If multiple status elements exist, the last
+		# one wins.
+		for node in testcaseNode.iterchildren(tag=Element):   # type: _Element
+			status = self._STATUS_TAGS.get(node.tag)
+			if status is not None:
+				newTestcase._status = status
+			elif node.tag not in self._IGNORED_TAGS:
+				raise UnittestException(f"Unknown element '{node.tag}' in junit file.")
 
 		if newTestcase._status is TestcaseStatus.Unknown:
 			newTestcase._status = TestcaseStatus.Passed
 
+	def _GenerateTime(self, duration: timedelta) -> str:
+		"""
+		Format a timedelta as ``time`` attribute value in seconds with microsecond resolution.
+
+		:param duration: The duration to format.
+		:return:         The formatted duration.
+		"""
+		return f"{duration.total_seconds():.6f}"
+
+	def _GenerateTimestamp(self, timestamp: datetime) -> str:
+		"""
+		Format a datetime as ``timestamp`` attribute value in ISO 8601 format.
+
+		The last formatted datetime object is remembered by identity, so consecutive elements referring to the same object
+		(e.g. test cases using their test suite's start time) are formatted only once. Equal datetimes with different time
+		zones aren't mixed up, because datetimes are compared by identity, not by value.
+
+		:param timestamp: The point in time to format.
+		:return:          The formatted timestamp.
+		"""
+		lastTimestamp, isoTimestamp = self._timestamp
+		if timestamp is not lastTimestamp:
+			isoTimestamp = timestamp.isoformat()
+			self._timestamp = (timestamp, isoTimestamp)
+		return isoTimestamp
+
 	def Generate(self, overwrite: bool = False) -> None:
 		"""
 		Generate the internal XML data structure from test suites and test cases.
@@ -1601,24 +1902,84 @@ class Document(TestsuiteSummary, ut_Document):
 		if not overwrite and self._xmlDocument is not None:
 			raise UnittestException(f"Internal XML document is populated with data.")
 
-		rootElement = Element("testsuites")
-		rootElement.attrib["name"] = self._name
+		rootElement = self._GenerateRoot()
+		self._xmlDocument = ElementTree(rootElement)
+
+		self._GenerateRootChildren(rootElement)
+
+	def _WriteIncrementally(self, file: BinaryIO, rootElement: _Element) -> None:
+		"""
+		Serialize the data model as XML into an opened file without building the whole XML data structure in memory.
+
+		Child elements of the root element are generated one at a time, written to the file and then detached again. The
+		output is formatted like a pretty-printed :meth:`Generate` result.
+
+		:param file:        The opened file to write into.
+		:param rootElement: The root XML element as generated by :meth:`_GenerateRoot`.
+		"""
+		elements = self._IterateRootChildren(rootElement)
+		firstElement = next(elements, None)
+
+		# The root's tags are formatted like in 'WriteFast'. libxml2 writes non-ASCII characters in attributes of a serialized
+		# element as character references, unless that element is the root of its document. Therefore, each child is copied
+		# into its own document before serialization.
+		startTag = self._SerializeStartTag(rootElement.tag, rootElement.attrib)
+		file.write(b"<?xml version='1.0' encoding='utf-8'?>\n")
+		if firstElement is None:
+			# Like a pretty-printed tree, a root element without children is written as an empty element tag.
+			file.write(f"{startTag}/>\n".encode("utf-8"))
+		else:
+			file.write(f"{startTag}>\n".encode("utf-8"))
+			for element in chain((firstElement, ), elements):
+				rootElement.remove(element)
+				indent(element, space="  ", level=1)
+				element.tail = "\n"
+				file.write(b"  ")
+				file.write(tostring(deepcopy(element), encoding="utf-8"))
+			file.write(f"</{rootElement.tag}>\n".encode("utf-8"))
+
+	def _GenerateRoot(self) -> _Element:
+		"""
+		Generate the XML root element (``<testsuites>``) without any child elements.
+
+		:return: The root XML element.
+		"""
+		attributes = {"name": self._name}
 		if self._startTime is not None:
-			rootElement.attrib["timestamp"] = f"{self._startTime.isoformat()}"
+			attributes["timestamp"] = self._GenerateTimestamp(self._startTime)
 		if self._duration is not None:
-			rootElement.attrib["time"] = f"{self._duration.total_seconds():.6f}"
-		rootElement.attrib["tests"] = str(self._tests)
-		rootElement.attrib["failures"] = str(self._failed)
-		rootElement.attrib["errors"] = str(self._errored)
-		rootElement.attrib["skipped"] = str(self._skipped)
+			attributes["time"] = self._GenerateTime(self._duration)
+		attributes["tests"] = f"{self._tests}"
+		attributes["failures"] = f"{self._failed}"
+		attributes["errors"] = f"{self._errored}"
+		attributes["skipped"] = f"{self._skipped}"
 		# if self._assertionCount is not None:
-		# 	rootElement.attrib["assertions"] = f"{self._assertionCount}"
+		# 	attributes["assertions"] = f"{self._assertionCount}"
+		return Element("testsuites", attributes)
 
-		self._xmlDocument = ElementTree(rootElement)
+	def _GenerateRootChildren(self, rootElement: _Element) -> None:
+		"""
+		Generate the XML elements below the root element (``<testsuite>``).
 
+		:param rootElement: The root XML element, generated elements will be added to.
+		"""
 		for testsuite in self._testsuites.values():
 			self._GenerateTestsuite(testsuite, rootElement)
 
+	def _IterateRootChildren(self, rootElement: _Element) -> Generator[_Element, None, None]:
+		"""
+		Generate the XML elements below the root element (``<testsuite>``) one at a time.
+
+		This is used by :meth:`_WriteIncrementally`, so each element can be written and detached before the next one is
+		generated.
+
+		:param rootElement: The root XML element, generated elements will be added to.
+		:return:            A generator yielding each generated child element after it was added.
+		"""
+		for testsuite in self._testsuites.values():
+			self._GenerateTestsuite(testsuite, rootElement)
+			yield rootElement[-1]
+
 	def _GenerateTestsuite(self, testsuite: Testsuite, parentElement: _Element) -> None:
 		"""
 		Generate the internal XML data structure for a test suite.
@@ -1629,20 +1990,7 @@ class Document(TestsuiteSummary, ut_Document):
 		:param parentElement: The parent XML data structure element, this data structure part will be added to.
 		:return:
 		"""
-		testsuiteElement = SubElement(parentElement, "testsuite")
-		testsuiteElement.attrib["name"] = testsuite._name
-		if testsuite._startTime is not None:
-			testsuiteElement.attrib["timestamp"] = f"{testsuite._startTime.isoformat()}"
-		if testsuite._duration is not None:
-			testsuiteElement.attrib["time"] = f"{testsuite._duration.total_seconds():.6f}"
-		testsuiteElement.attrib["tests"] = str(testsuite._tests)
-		testsuiteElement.attrib["failures"] = str(testsuite._failed)
-		testsuiteElement.attrib["errors"] = str(testsuite._errored)
-		testsuiteElement.attrib["skipped"] = str(testsuite._skipped)
-		# if testsuite._assertionCount is not None:
-		# 	testsuiteElement.attrib["assertions"] = f"{testsuite._assertionCount}"
-		if testsuite._hostname is not None:
-			testsuiteElement.attrib["hostname"] = testsuite._hostname
+		testsuiteElement = SubElement(parentElement, "testsuite", self._GenerateTestsuiteAttributes(testsuite))
 
 		for testclass in testsuite._testclasses.values():
 			for tc in testclass._testcases.values():
@@ -1658,23 +2006,108 @@ class Document(TestsuiteSummary, ut_Document):
 		:param parentElement: The parent XML data structure element, this data structure part will be added to.
 		:return:
 		"""
-		testcaseElement = SubElement(parentElement, "testcase")
+		testcaseElement = SubElement(parentElement, "testcase", self._GenerateTestcaseAttributes(testcase))
+
+		if testcase._status is not TestcaseStatus.Passed:
+			SubElement(testcaseElement, self._STATUS_ELEMENTS.get(testcase._status, "error"))
+
+	def _SerializeRootChildren(self, lines: List[str]) -> None:
+		"""
+		Format the XML elements below the root element (``<testsuite>``) as indented lines of XML text.
+
+		:param lines: The list of lines, formatted lines will be appended to.
+		"""
+		for testsuite in self._testsuites.values():
+			self._SerializeTestsuite(testsuite, lines)
+
+	def _SerializeTestsuite(self, testsuite: Testsuite, lines: List[str]) -> None:
+		"""
+		Format a test suite (``<testsuite>``) and its test cases as indented lines of XML text.
+
+		:param testsuite: The test suite to format.
+		:param lines:     The list of lines, formatted lines will be appended to.
+		"""
+		startTagIndex = len(lines)
+		lines.append(f"  {self._SerializeStartTag('testsuite', self._GenerateTestsuiteAttributes(testsuite))}")
+
+		for testclass in testsuite._testclasses.values():
+			for tc in testclass._testcases.values():
+				self._SerializeTestcase(tc, lines, "    ")
+
+		if len(lines) == startTagIndex + 1:
+			lines[startTagIndex] += "/>"
+		else:
+			lines[startTagIndex] += ">"
+			lines.append("  </testsuite>")
+
+	def _SerializeTestcase(self, testcase: Testcase, lines: List[str], indentation: str) -> None:
+		"""
+		Format a test case (``<testcase>``) as indented lines of XML text.
+
+		:param testcase:    The test case to format.
+		:param lines:       The list of lines, formatted lines will be appended to.
+		:param indentation: The indentation of the test case element.
+		"""
+		startTag = self._SerializeStartTag("testcase", self._GenerateTestcaseAttributes(testcase))
+
+		if testcase._status is TestcaseStatus.Passed:
+			lines.append(f"{indentation}{startTag}/>")
+		else:
+			lines.append(f"{indentation}{startTag}>")
+			lines.append(f"{indentation}  <{self._STATUS_ELEMENTS.get(testcase._status, 'error')}/>")
+			lines.append(f"{indentation}</testcase>")
+
+	def _SerializeStartTag(self, tag: str, attributes: Dict[str, str]) -> str:
+		"""
+		Format an unterminated XML start tag including its attributes, e.g. ``<testcase name="..."``.
+
+		:param tag:        The element's tag.
+		:param attributes: The element's attributes.
+		:return:           The XML start tag without closing ``>`` or ``/>``.
+		"""
+		escapes = self._ATTRIBUTE_ESCAPES
+		return f"<{tag}" + "".join([f" {name}=\"{value.translate(escapes)}\"" for name, value in attributes.items()])
+
+	def _GenerateTestsuiteAttributes(self, testsuite: Testsuite) -> Dict[str, str]:
+		"""
+		Generate the XML attributes of a test suite element (``<testsuite>``).
+
+		:param testsuite: The test suite to convert to XML attributes.
+		:return:          The XML attributes in order of appearance.
+		"""
+		attributes = {"name": testsuite._name}
+		if testsuite._startTime is not None:
+			attributes["timestamp"] = self._GenerateTimestamp(testsuite._startTime)
+		if testsuite._duration is not None:
+			attributes["time"] = self._GenerateTime(testsuite._duration)
+		attributes["tests"] = f"{testsuite._tests}"
+		attributes["failures"] = f"{testsuite._failed}"
+		attributes["errors"] = f"{testsuite._errored}"
+		attributes["skipped"] = f"{testsuite._skipped}"
+		# if testsuite._assertionCount is not None:
+		# 	attributes["assertions"] = f"{testsuite._assertionCount}"
+		if testsuite._hostname is not None:
+			attributes["hostname"] = testsuite._hostname
+
+		return attributes
+
+	def _GenerateTestcaseAttributes(self, testcase: Testcase) -> Dict[str, str]:
+		"""
+		Generate the XML attributes of a test case element (``<testcase>``).
+
+		:param testcase: The test case to convert to XML attributes.
+		:return:         The XML attributes in order of appearance.
+		"""
+		attributes = {}
 		if testcase.Classname is not None:
-			testcaseElement.attrib["classname"] = testcase.Classname
-		testcaseElement.attrib["name"] = testcase._name
+			attributes["classname"] = testcase.Classname
+		attributes["name"] = testcase._name
 		if testcase._duration is not None:
-			testcaseElement.attrib["time"] = f"{testcase._duration.total_seconds():.6f}"
+			attributes["time"] = self._GenerateTime(testcase._duration)
 		if testcase._assertionCount is not None:
-			testcaseElement.attrib["assertions"] = f"{testcase._assertionCount}"
+			attributes["assertions"] = f"{testcase._assertionCount}"
 
-		if testcase._status is TestcaseStatus.Passed:
-			pass
-		elif testcase._status is TestcaseStatus.Failed:
-			failureElement = SubElement(testcaseElement, "failure")
-		elif testcase._status is TestcaseStatus.Skipped:
-			skippedElement = SubElement(testcaseElement, "skipped")
-		else:
-			errorElement = SubElement(testcaseElement, "error")
+		return attributes
 
 	def __str__(self) -> str:
 		moduleName = self.__module__.split(".")[-1]
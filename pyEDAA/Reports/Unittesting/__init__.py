@@ -72,8 +72,10 @@ derived from a summary class.
 		 classDef suite fill:#b3e6ff
 		 classDef case fill:#eeccff
 """
+from collections           import Counter
 from datetime              import timedelta, datetime
 from enum                  import Flag, IntEnum
+from operator              import attrgetter
 from pathlib               import Path
 from sys                   import version_info
 from typing                import Optional as Nullable, Dict, Iterable, Any, Tuple, Generator, Union, List, Generic, TypeVar, Mapping
@@ -279,7 +281,7 @@ class Base(metaclass=ExtendedType, slots=True):
 	_errorCount:   int
 	_fatalCount:   int
 
-	_dict:         Dict[str, Any]
+	_dict:         Nullable[Dict[str, Any]]  #: Key-value pairs, allocated on first use.
 
 	def __init__(
 		self,
@@ -437,7 +439,7 @@ class Base(metaclass=ExtendedType, slots=True):
 				ex.add_note(f"Got type '{getFullyQualifiedName(keyValuePairs)}'.")
 			raise ex
 
-		self._dict = {} if keyValuePairs is None else {k: v for k, v in keyValuePairs}
+		self._dict = None if keyValuePairs is None else {k: v for k, v in keyValuePairs}
 
 	# QUESTION: allow Parent as setter?
 	@readonly
@@ -541,6 +543,9 @@ class Base(metaclass=ExtendedType, slots=True):
 
 		:return: Number of annotated key-value pairs.
 		"""
+		if self._dict is None:
+			return 0
+
 		return len(self._dict)
 
 	def __getitem__(self, key: str) -> Any:
@@ -550,6 +555,9 @@ class Base(metaclass=ExtendedType, slots=True):
 		:param key: Name if the key-value pair.
 		:return:    Value of the accessed key.
 		"""
+		if self._dict is None:
+			raise KeyError(key)
+
 		return self._dict[key]
 
 	def __setitem__(self, key: str, value: Any) -> None:
@@ -561,7 +569,10 @@ class Base(metaclass=ExtendedType, slots=True):
 		:param key:   Key of the key-value pair.
 		:param value: Value of the key-value pair.
 		"""
-		self._dict[key] = value
+		if self._dict is None:
+			self._dict = {key: value}
+		else:
+			self._dict[key] = value
 
 	def __delitem__(self, key: str) -> None:
 		"""
@@ -569,7 +580,12 @@ class Base(metaclass=ExtendedType, slots=True):
 
 		:param key: Name if the key-value pair.
 		"""
+		if self._dict is None:
+			raise KeyError(key)
+
 		del self._dict[key]
+		if len(self._dict) == 0:
+			self._dict = None
 
 	def __contains__(self, key: str) -> bool:
 		"""
@@ -578,7 +594,7 @@ class Base(metaclass=ExtendedType, slots=True):
 		:param key: Name of the key-value pair.
 		:return:    True, if the pair was annotated.
 		"""
-		return key in self._dict
+		return self._dict is not None and key in self._dict
 
 	def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
 		"""
@@ -586,7 +602,8 @@ class Base(metaclass=ExtendedType, slots=True):
 
 		:return: A generator of key-value pair tuples (key, value).
 		"""
-		yield from self._dict.items()
+		if self._dict is not None:
+			yield from self._dict.items()
 
 	@abstractmethod
 	def Aggregate(self, strict: bool = True):
@@ -1002,7 +1019,14 @@ class TestsuiteBase(Base, Generic[TestsuiteType]):
 
 		:return: Number of test suites.
 		"""
-		return 1 + sum(testsuite.TestsuiteCount for testsuite in self._testsuites.values())
+		count = 1
+		stack = list(self._testsuites.values())
+		while stack:
+			testsuite = stack.pop()
+			count += 1
+			stack.extend(testsuite._testsuites.values())
+
+		return count
 
 	@readonly
 	def TestcaseCount(self) -> int:
@@ -1011,7 +1035,14 @@ class TestsuiteBase(Base, Generic[TestsuiteType]):
 
 		:return: Number of test cases.
 		"""
-		return sum(testsuite.TestcaseCount for testsuite in self._testsuites.values())
+		count = 0
+		stack = list(self._testsuites.values())
+		while stack:
+			testsuite = stack.pop()
+			count += len(testsuite._testcases)
+			stack.extend(testsuite._testsuites.values())
+
+		return count
 
 	@readonly
 	def AssertionCount(self) -> int:
@@ -1125,6 +1156,34 @@ class TestsuiteBase(Base, Generic[TestsuiteType]):
 		# return self._fatalCount
 
 	def Aggregate(self, strict: bool = True) -> TestsuiteAggregateReturnType:
+		"""
+		Aggregate all nested test suites and return the summed results of the direct child test suites.
+
+		The hierarchy is walked without recursion, therefore the :meth:`Aggregate` method of nested test suites is **not**
+		called. Instead, each nested test suite's :meth:`Testsuite._Aggregate` hook is called with the summed results of its
+		own child test suites. Subclasses customizing the aggregation of a test suite must override ``_Aggregate``.
+
+		:param strict: If true, fatal errors turn test cases into failed test cases.
+		:return:       Summed aggregation results of all child test suites.
+		"""
+		# Collect all nested test suites in pre-order using an explicit stack, then aggregate them in reverse order. Thus,
+		# every test suite is aggregated after its child test suites without recursing through the hierarchy.
+		testsuites = []
+		stack = list(self._testsuites.values())
+		while stack:
+			testsuite = stack.pop()
+			testsuites.append(testsuite)
+			stack.extend(testsuite._testsuites.values())
+
+		results = {}
+		for testsuite in reversed(testsuites):
+			childResults = [results.pop(id(child)) for child in testsuite._testsuites.values()]
+			results[id(testsuite)] = testsuite._Aggregate(strict, self._SumAggregates(childResults))
+
+		return self._SumAggregates(results[id(testsuite)] for testsuite in self._testsuites.values())
+
+	@staticmethod
+	def _SumAggregates(aggregates: Iterable[TestsuiteAggregateReturnType]) -> TestsuiteAggregateReturnType:
 		tests = 0
 		inconsistent = 0
 		excluded = 0
@@ -1140,8 +1199,7 @@ class TestsuiteBase(Base, Generic[TestsuiteType]):
 
 		totalDuration = timedelta()
 
-		for testsuite in self._testsuites.values():
-			t, i, ex, s, e, w, f, p, wc, ec, fc, td = testsuite.Aggregate(strict)
+		for t, i, ex, s, e, w, f, p, wc, ec, fc, td in aggregates:
 			tests += t
 			inconsistent += i
 			excluded += ex
@@ -1159,15 +1217,17 @@ class TestsuiteBase(Base, Generic[TestsuiteType]):
 
 		return tests, inconsistent, excluded, skipped, errored, weak, failed, passed, warningCount, errorCount, fatalCount, totalDuration
 
-	def AddTestsuite(self, testsuite: TestsuiteType) -> None:
+	def _CheckTestsuite(self, testsuite: TestsuiteType, newTestsuites: Nullable[Dict[str, TestsuiteType]] = None) -> None:
 		"""
-		Add a test suite to the list of test suites.
+		Check if a test suite can be added to the list of test suites.
 
-		:param testsuite:   The test suite to add.
-		:raises ValueError: If parameter 'testsuite' is None.
-		:raises TypeError:  If parameter 'testsuite' is not a Testsuite.
+		:param testsuite:     The test suite to check.
+		:param newTestsuites: Optional test suites, which are about to be added together with the checked test suite.
+		:raises ValueError:   If parameter 'testsuite' is None.
+		:raises TypeError:    If parameter 'testsuite' is not a Testsuite.
 		:raises AlreadyInHierarchyException: If parameter 'testsuite' is already part of a test entity hierarchy.
-		:raises DuplicateTestcaseException:  If parameter 'testsuite' is already listed (by name) in the list of test suites.
+		:raises DuplicateTestsuiteException: If parameter 'testsuite' is already listed (by name) in the list of test suites
+		                                     or in parameter 'newTestsuites'.
 		"""
 		if testsuite is None:
 			raise ValueError("Parameter 'testsuite' is None.")
@@ -1180,9 +1240,21 @@ class TestsuiteBase(Base, Generic[TestsuiteType]):
 		if testsuite._parent is not None:
 			raise AlreadyInHierarchyException(f"Testsuite '{testsuite._name}' is already part of a testsuite hierarchy.")
 
-		if testsuite._name in self._testsuites:
+		if testsuite._name in self._testsuites or (newTestsuites is not None and testsuite._name in newTestsuites):
 			raise DuplicateTestsuiteException(f"Testsuite already contains a testsuite with same name '{testsuite._name}'.")
 
+	def AddTestsuite(self, testsuite: TestsuiteType) -> None:
+		"""
+		Add a test suite to the list of test suites.
+
+		:param testsuite:   The test suite to add.
+		:raises ValueError: If parameter 'testsuite' is None.
+		:raises TypeError:  If parameter 'testsuite' is not a Testsuite.
+		:raises AlreadyInHierarchyException: If parameter 'testsuite' is already part of a test entity hierarchy.
+		:raises DuplicateTestsuiteException: If parameter 'testsuite' is already listed (by name) in the list of test suites.
+		"""
+		self._CheckTestsuite(testsuite)
+
 		testsuite._parent = self
 		self._testsuites[testsuite._name] = testsuite
 
@@ -1190,9 +1262,15 @@ class TestsuiteBase(Base, Generic[TestsuiteType]):
 		"""
 		Add a list of test suites to the list of test suites.
 
+		All test suites are checked before the first one is added, thus no test suite is added if any check fails.
+
 		:param testsuites:  List of test suites to add.
 		:raises ValueError: If parameter 'testsuites' is None.
 		:raises TypeError:  If parameter 'testsuites' is not iterable.
+		:raises ValueError: If an element of parameter 'testsuites' is None.
+		:raises TypeError:  If an element of parameter 'testsuites' is not a Testsuite.
+		:raises AlreadyInHierarchyException: If an element of parameter 'testsuites' is already part of a test entity hierarchy.
+		:raises DuplicateTestsuiteException: If an element of parameter 'testsuites' is already listed (by name) in the list of test suites.
 		"""
 		if testsuites is None:
 			raise ValueError("Parameter 'testsuites' is None.")
@@ -1202,8 +1280,15 @@ class TestsuiteBase(Base, Generic[TestsuiteType]):
 				ex.add_note(f"Got type '{getFullyQualifiedName(testsuites)}'.")
 			raise ex
 
+		newTestsuites = {}
 		for testsuite in testsuites:
-			self.AddTestsuite(testsuite)
+			self._CheckTestsuite(testsuite, newTestsuites)
+			newTestsuites[testsuite._name] = testsuite
+
+		for testsuite in newTestsuites.values():
+			testsuite._parent = self
+
+		self._testsuites.update(newTestsuites)
 
 	@abstractmethod
 	def Iterate(self, scheme: IterationScheme = IterationScheme.Default) -> Generator[Union[TestsuiteType, Testcase], None, None]:
@@ -1218,20 +1303,16 @@ class TestsuiteBase(Base, Generic[TestsuiteType]):
 	def ToTree(self) -> Node:
 		rootNode = Node(value=self._name)
 
-		def convertTestcase(testcase: Testcase, parentNode: Node) -> None:
-			_ = Node(value=testcase._name, parent=parentNode)
-
-		def convertTestsuite(testsuite: Testsuite, parentNode: Node) -> None:
-			testsuiteNode = Node(value=testsuite._name, parent=parentNode)
+		# Nodes are created when their parent is visited, so child test suites are ordered before test cases.
+		worklist = [(testsuite, Node(value=testsuite._name, parent=rootNode)) for testsuite in self._testsuites.values()]
+		while worklist:
+			testsuite, testsuiteNode = worklist.pop()
 
 			for ts in testsuite._testsuites.values():
-				convertTestsuite(ts, testsuiteNode)
+				worklist.append((ts, Node(value=ts._name, parent=testsuiteNode)))
 
 			for tc in testsuite._testcases.values():
-				convertTestcase(tc, testsuiteNode)
-
-		for testsuite in self._testsuites.values():
-			convertTestsuite(testsuite, rootNode)
+				_ = Node(value=tc._name, parent=testsuiteNode)
 
 		return rootNode
 
@@ -1367,12 +1448,24 @@ class Testsuite(TestsuiteBase[TestsuiteType]):
 		)
 
 	def Aggregate(self, strict: bool = True) -> TestsuiteAggregateReturnType:
-		tests, inconsistent, excluded, skipped, errored, weak, failed, passed, warningCount, errorCount, fatalCount, totalDuration = super().Aggregate()
+		return self._Aggregate(strict, super().Aggregate(strict))
 
-		for testcase in self._testcases.values():
-			wc, ec, fc, td = testcase.Aggregate(strict)
+	def _Aggregate(self, strict: bool, testsuiteResults: TestsuiteAggregateReturnType) -> TestsuiteAggregateReturnType:
+		"""
+		Aggregate this test suite's test cases on top of the already aggregated results of its child test suites.
 
-			tests += 1
+		This is the per-test suite hook called by :meth:`TestsuiteBase.Aggregate` for every nested test suite. Subclasses
+		customizing the aggregation must override this method, because :meth:`Aggregate` isn't called for nested test suites.
+
+		:param strict:           If true, fatal errors turn test cases into failed test cases.
+		:param testsuiteResults: Summed aggregation results of all child test suites.
+		:return:                 Aggregation results of this test suite.
+		"""
+		tests, inconsistent, excluded, skipped, errored, weak, failed, passed, warningCount, errorCount, fatalCount, totalDuration = testsuiteResults
+
+		testcases = self._testcases.values()
+		for testcase in testcases:
+			wc, ec, fc, td = testcase.Aggregate(strict)
 
 			warningCount += wc
 			errorCount +=   ec
@@ -1380,23 +1473,26 @@ class Testsuite(TestsuiteBase[TestsuiteType]):
 
 			totalDuration += td
 
-			status = testcase._status
+		# Test case states are tallied in one pass, then the counters are read out per state. Remaining states are checked in
+		# order of their first occurrence, so an error reports the first test case with an unsupported state.
+		tests += len(testcases)
+		statusCounts = Counter(map(attrgetter("_status"), testcases))
+
+		passed +=   statusCounts.pop(TestcaseStatus.Passed, 0)
+		failed +=   statusCounts.pop(TestcaseStatus.Failed, 0)
+		skipped +=  statusCounts.pop(TestcaseStatus.Skipped, 0)
+		excluded += statusCounts.pop(TestcaseStatus.Excluded, 0)
+		errored +=  statusCounts.pop(TestcaseStatus.Errored, 0)
+		weak +=     statusCounts.pop(TestcaseStatus.Weak, 0)
+
+		for status, count in statusCounts.items():
+			if TestcaseStatus.Inconsistent in status:
+				inconsistent += count
+				continue
+
+			testcase = next(tc for tc in testcases if tc._status == status)
 			if status is TestcaseStatus.Unknown:
 				raise UnittestException(f"Found testcase '{testcase._name}' with state 'Unknown'.")
-			elif TestcaseStatus.Inconsistent in status:
-				inconsistent += 1
-			elif status is TestcaseStatus.Excluded:
-				excluded += 1
-			elif status is TestcaseStatus.Skipped:
-				skipped += 1
-			elif status is TestcaseStatus.Errored:
-				errored += 1
-			elif status is TestcaseStatus.Weak:
-				weak += 1
-			elif status is TestcaseStatus.Passed:
-				passed += 1
-			elif status is TestcaseStatus.Failed:
-				failed += 1
 			elif status & TestcaseStatus.Mask is not TestcaseStatus.Unknown:
 				raise UnittestException(f"Found testcase '{testcase._name}' with unsupported state '{status}'.")
 			else:
@@ -1482,24 +1578,37 @@ class Testsuite(TestsuiteBase[TestsuiteType]):
 	def Iterate(self, scheme: IterationScheme = IterationScheme.Default) -> Generator[Union[TestsuiteType, Testcase], None, None]:
 		assert IterationScheme.PreOrder | IterationScheme.PostOrder not in scheme
 
+		includeSelf = IterationScheme.IncludeSelf | IterationScheme.IncludeTestsuites in scheme
+		includeTestsuites = IterationScheme.IncludeTestsuites in scheme
+		includeTestcases = IterationScheme.IncludeTestcases in scheme
+
+		# Nested test suites are always included (if test suites are requested), only this test suite depends on IncludeSelf.
 		if IterationScheme.PreOrder in scheme:
-			if IterationScheme.IncludeSelf | IterationScheme.IncludeTestsuites in scheme:
-				yield self
+			stack = [self]
+			while stack:
+				testsuite = stack.pop()
+				if includeSelf if testsuite is self else includeTestsuites:
+					yield testsuite
 
-			if IterationScheme.IncludeTestcases in scheme:
-				for testcase in self._testcases.values():
-					yield testcase
+				if includeTestcases:
+					yield from testsuite._testcases.values()
 
-		for testsuite in self._testsuites.values():
-			yield from testsuite.Iterate(scheme | IterationScheme.IncludeSelf)
+				stack.extend(reversed(testsuite._testsuites.values()))
+
+		elif IterationScheme.PostOrder in scheme:
+			stack = [(self, False)]
+			while stack:
+				testsuite, visited = stack.pop()
+				if not visited:
+					stack.append((testsuite, True))
+					stack.extend((ts, False) for ts in reversed(testsuite._testsuites.values()))
+					continue
 
-		if IterationScheme.PostOrder in scheme:
-			if IterationScheme.IncludeTestcases in scheme:
-				for testcase in self._testcases.values():
-					yield testcase
+				if includeTestcases:
+					yield from testsuite._testcases.values()
 
-			if IterationScheme.IncludeSelf | IterationScheme.IncludeTestsuites in scheme:
-				yield self
+				if includeSelf if testsuite is self else includeTestsuites:
+					yield testsuite
 
 	def __str__(self) -> str:
 		return (
@@ -1604,13 +1713,16 @@ class TestsuiteSummary(TestsuiteBase[TestsuiteType]):
 		return tests, inconsistent, excluded, skipped, errored, weak, failed, passed, warningCount, errorCount, fatalCount, totalDuration
 
 	def Iterate(self, scheme: IterationScheme = IterationScheme.Default) -> Generator[Union[TestsuiteType, Testcase], None, None]:
-		if IterationScheme.IncludeSelf | IterationScheme.IncludeTestsuites | IterationScheme.PreOrder in scheme:
+		includeSelf = IterationScheme.IncludeSelf | IterationScheme.IncludeTestsuites in scheme
+		testsuiteScheme = scheme | IterationScheme.IncludeSelf
+
+		if includeSelf and IterationScheme.PreOrder in scheme:
 			yield self
 
 		for testsuite in self._testsuites.values():
-			yield from testsuite.IterateTestsuites(scheme | IterationScheme.IncludeSelf)
+			yield from testsuite.IterateTestsuites(testsuiteScheme)
 
-		if IterationScheme.IncludeSelf | IterationScheme.IncludeTestsuites | IterationScheme.PostOrder in scheme:
+		if includeSelf and IterationScheme.PostOrder in scheme:
 			yield self
 
 	def __str__(self) -> str:
@@ -107,6 +107,32 @@ class TestcaseInstantiation(ut_TestCase):
 		self.assertEqual(4, tc.PassedAssertionCount)
 
 
+class KeyValuePairs(ut_TestCase):
+	def test_Empty(self) -> None:
+		tc = Testcase("test")
+
+		self.assertEqual(0, len(tc))
+		self.assertNotIn("key", tc)
+		self.assertListEqual([], list(tc))
+		with self.assertRaises(KeyError):
+			_ = tc["key"]
+		with self.assertRaises(KeyError):
+			del tc["key"]
+
+	def test_SetGetDelete(self) -> None:
+		tc = Testcase("test")
+		tc["key"] = "value"
+
+		self.assertEqual(1, len(tc))
+		self.assertIn("key", tc)
+		self.assertEqual("value", tc["key"])
+		self.assertListEqual([("key", "value")], list(tc))
+
+		del tc["key"]
+		self.assertEqual(0, len(tc))
+		self.assertIsNone(tc._dict)
+
+
 class TestsuiteInstantiation(ut_TestCase):
 	def test_Testsuite_NoName(self) -> None:
 		with self.assertRaises(ValueError):
@@ -204,6 +230,29 @@ class Hierarchy(ut_TestCase):
 		self.assertEqual(ts, ts1.Parent)
 		self.assertEqual(ts, ts2.Parent)
 
+	def test_AddTestsuites_Duplicate(self) -> None:
+		ts = Testsuite("root")
+		ts1 = Testsuite("ts1")
+		ts2 = Testsuite("ts1")
+
+		with self.assertRaises(DuplicateTestsuiteException):
+			ts.AddTestsuites((ts1, ts2))
+
+		self.assertEqual(0, len(ts.Testsuites))
+		self.assertIsNone(ts1.Parent)
+
+	def test_AddTestsuites_WrongType(self) -> None:
+		ts = Testsuite("root")
+		ts1 = Testsuite("ts1")
+
+		with self.assertRaises(TypeError):
+			ts.AddTestsuite(Testcase("tc1"))
+		with self.assertRaises(TypeError):
+			ts.AddTestsuites((ts1, Testcase("tc2")))
+
+		self.assertEqual(0, len(ts.Testsuites))
+		self.assertIsNone(ts1.Parent)
+
 	def test_AddTestcase(self) -> None:
 		ts = Testsuite("root")
 		tc1 = Testcase("tc1")
@@ -290,6 +339,21 @@ class Aggregate(ut_TestCase):
 
 		ts.Aggregate()
 
+	def test_AggregateDeepHierarchy(self) -> None:
+		root = TestsuiteSummary("summary")
+		parent = root
+		for i in range(2000):
+			parent = Testsuite(f"ts{i}", parent=parent)
+			_ = Testcase(f"tc{i}", parent=parent, status=TestcaseStatus.Passed)
+
+		root.Aggregate()
+
+		self.assertEqual(2000, root.Tests)
+		self.assertEqual(2000, root.Passed)
+		self.assertEqual(1, parent.Tests)
+		self.assertEqual(TestsuiteStatus.Passed, root.Status)
+		self.assertEqual(4000, len(list(root._testsuites["ts0"].Iterate(IterationScheme.Default | IterationScheme.IncludeSelf))))
+
 
 def CreateTestsuiteStructure(rootIsSummary: bool = True, empty: bool = False) -> Testsuite:
 	if rootIsSummary:
@@ -335,6 +399,20 @@ def CreateTestsuiteStructure(rootIsSummary: bool = True, empty: bool = False) ->
 	return root
 
 
+class Counts(ut_TestCase):
+	def test_TestsuiteSummary(self) -> None:
+		root = CreateTestsuiteStructure(rootIsSummary=True)
+
+		self.assertEqual(10, root.TestsuiteCount)
+		self.assertEqual(18, root.TestcaseCount)
+
+	def test_Testsuite(self) -> None:
+		root = CreateTestsuiteStructure(rootIsSummary=False)
+
+		self.assertEqual(10, root.TestsuiteCount)
+		self.assertEqual(20, root.TestcaseCount)
+
+
 class Iterator(ut_TestCase):
 	def test_Testsuite_Iterate(self) -> None:
 		root = CreateTestsuiteStructure(rootIsSummary=False)
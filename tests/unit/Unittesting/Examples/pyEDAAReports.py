@@ -32,11 +32,14 @@
 from pathlib      import Path
 from unittest     import TestCase
 
+from lxml.etree       import parse, tostring
 from pyTooling.Common import zipdicts
 
 # FIXME: change to generic JUnit
-from pyEDAA.Reports.Unittesting.JUnit.AntJUnit4        import Document as JUnit4Document
-from pyEDAA.Reports.Unittesting.JUnit.CTestJUnit      import Document as CTestDocument
+from pyEDAA.Reports.Unittesting                 import TestcaseStatus
+from pyEDAA.Reports.Unittesting.JUnit.AntJUnit4        import Document as JUnit4Document, Testsuite as JUnit4Testsuite
+from pyEDAA.Reports.Unittesting.JUnit.AntJUnit4        import Testclass as JUnit4Testclass, Testcase as JUnit4Testcase
+from pyEDAA.Reports.Unittesting.JUnit.CTestJUnit      import Document as CTestDocument, Testsuite as CTestTestsuite
 from pyEDAA.Reports.Unittesting.JUnit.GoogleTestJUnit import Document as GTestDocument
 from pyEDAA.Reports.Unittesting.JUnit.PyTestJUnit     import Document as PyTestDocument
 
@@ -109,6 +112,69 @@ class CppGoogleTest(TestCase):
 					self.assertEqual(tc.Duration, sameTC.Duration)
 					self.assertEqual(tc.AssertionCount, sameTC.AssertionCount)
 
+	def test_AnalyzeAndConvert(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Cpp-GoogleTest/gtest.xml")
+		streamedDoc = GTestDocument(junitExampleFile)
+		streamedDoc.AnalyzeAndConvert()
+		doc = GTestDocument(junitExampleFile, analyzeAndConvert=True)
+
+		self.assertIsNone(streamedDoc._xmlDocument)
+		self.assertEqual(doc.TestsuiteCount, streamedDoc.TestsuiteCount)
+		self.assertEqual(doc.TestcaseCount, streamedDoc.TestcaseCount)
+		self.assertEqual(doc.Status, streamedDoc.Status)
+
+	def test_WriteIncrementally(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Cpp-GoogleTest/gtest.xml")
+		doc = GTestDocument(junitExampleFile)
+		doc.AnalyzeAndConvert()
+
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Cpp-GoogleTest/gtest.incremental.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc.Write(junitOutputFile, regenerate=True, overwrite=True)
+		self.assertIsNone(doc._xmlDocument)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_WriteIncrementally_Empty(self):
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Cpp-GoogleTest/gtest.empty.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc = GTestDocument(junitOutputFile)
+		doc.Aggregate()
+
+		doc.Write(junitOutputFile, regenerate=True, overwrite=True)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertTrue(expected.endswith(b"/>\n"))
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_WriteFast(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Cpp-GoogleTest/gtest.xml")
+		doc = GTestDocument(junitExampleFile)
+		doc.AnalyzeAndConvert()
+
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Cpp-GoogleTest/gtest.fast.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc.WriteFast(junitOutputFile, overwrite=True)
+		self.assertIsNone(doc._xmlDocument)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_Write(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Cpp-GoogleTest/gtest.xml")
+		doc = GTestDocument(junitExampleFile, analyzeAndConvert=True)
+
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Cpp-GoogleTest/gtest.unchanged.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc.Write(junitOutputFile, overwrite=True)
+
+		expected = tostring(parse(str(junitExampleFile)), encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
 
 class CppGoogleTestCTest(TestCase):
 	def test_ctest(self):
@@ -172,6 +238,70 @@ class CppGoogleTestCTest(TestCase):
 					self.assertEqual(tc.Duration, sameTC.Duration)
 					self.assertEqual(tc.AssertionCount, sameTC.AssertionCount)
 
+	def test_Write(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Cpp-GoogleTest/ctest.xml")
+		doc = CTestDocument(junitExampleFile, analyzeAndConvert=True)
+
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Cpp-GoogleTest/ctest.unchanged.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc.Write(junitOutputFile, overwrite=True)
+
+		expected = tostring(parse(str(junitExampleFile)), encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_AnalyzeAndConvert(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Cpp-GoogleTest/ctest.xml")
+		streamedDoc = CTestDocument(junitExampleFile)
+		streamedDoc.AnalyzeAndConvert()
+		doc = CTestDocument(junitExampleFile, analyzeAndConvert=True)
+
+		self.assertIsNone(streamedDoc._xmlDocument)
+		self.assertEqual(doc.TestsuiteCount, streamedDoc.TestsuiteCount)
+		self.assertEqual(doc.TestcaseCount, streamedDoc.TestcaseCount)
+		self.assertEqual(doc.Status, streamedDoc.Status)
+
+	def test_WriteIncrementally(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Cpp-GoogleTest/ctest.xml")
+		doc = CTestDocument(junitExampleFile)
+		doc.AnalyzeAndConvert()
+
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Cpp-GoogleTest/ctest.incremental.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc.Write(junitOutputFile, regenerate=True, overwrite=True)
+		self.assertIsNone(doc._xmlDocument)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_WriteIncrementally_Empty(self):
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Cpp-GoogleTest/ctest.empty.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc = CTestDocument(junitOutputFile)
+		doc.AddTestsuite(CTestTestsuite("Empty"))
+		doc.Aggregate()
+
+		doc.Write(junitOutputFile, regenerate=True, overwrite=True)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertTrue(expected.endswith(b"/>\n"))
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_WriteFast(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Cpp-GoogleTest/ctest.xml")
+		doc = CTestDocument(junitExampleFile)
+		doc.AnalyzeAndConvert()
+
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Cpp-GoogleTest/ctest.fast.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc.WriteFast(junitOutputFile, overwrite=True)
+		self.assertIsNone(doc._xmlDocument)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
 
 class JavaAntJUnit4(TestCase):
 	def test_JUnit4(self):
@@ -235,6 +365,88 @@ class JavaAntJUnit4(TestCase):
 					self.assertEqual(tc.Duration, sameTC.Duration)
 					self.assertEqual(tc.AssertionCount, sameTC.AssertionCount)
 
+	def test_Write(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Java-Ant-JUnit4/TEST-my.AllTests.xml")
+		doc = JUnit4Document(junitExampleFile, analyzeAndConvert=True)
+
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Java-Ant-JUnit4/TEST-my.AllTests.unchanged.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc.Write(junitOutputFile, overwrite=True)
+
+		expected = tostring(parse(str(junitExampleFile)), encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_AnalyzeAndConvert(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Java-Ant-JUnit4/TEST-my.AllTests.xml")
+		streamedDoc = JUnit4Document(junitExampleFile)
+		streamedDoc.AnalyzeAndConvert()
+		doc = JUnit4Document(junitExampleFile, analyzeAndConvert=True)
+
+		self.assertIsNone(streamedDoc._xmlDocument)
+		self.assertEqual(doc.TestsuiteCount, streamedDoc.TestsuiteCount)
+		self.assertEqual(doc.TestcaseCount, streamedDoc.TestcaseCount)
+		self.assertEqual(doc.Status, streamedDoc.Status)
+
+	def test_WriteIncrementally(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Java-Ant-JUnit4/TEST-my.AllTests.xml")
+		doc = JUnit4Document(junitExampleFile)
+		doc.AnalyzeAndConvert()
+
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Java-Ant-JUnit4/TEST-my.AllTests.incremental.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc.Write(junitOutputFile, regenerate=True, overwrite=True)
+		self.assertIsNone(doc._xmlDocument)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_WriteIncrementally_Empty(self):
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Java-Ant-JUnit4/TEST-my.AllTests.empty.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc = JUnit4Document(junitOutputFile)
+		doc.AddTestsuite(JUnit4Testsuite("Empty"))
+		doc.Aggregate()
+
+		doc.Write(junitOutputFile, regenerate=True, overwrite=True)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertTrue(expected.endswith(b"/>\n"))
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_WriteFast(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Java-Ant-JUnit4/TEST-my.AllTests.xml")
+		doc = JUnit4Document(junitExampleFile)
+		doc.AnalyzeAndConvert()
+
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Java-Ant-JUnit4/TEST-my.AllTests.fast.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc.WriteFast(junitOutputFile, overwrite=True)
+		self.assertIsNone(doc._xmlDocument)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_WriteIncrementally_NonASCII(self):
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Java-Ant-JUnit4/TEST-my.AllTests.nonascii.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc = JUnit4Document(junitOutputFile)
+		ts = JUnit4Testsuite("tests/test_ünïcode.py")
+		cls = JUnit4Testclass("test_ünïcode.Tëst", parent=ts)
+		JUnit4Testcase("tëst_ü", status=TestcaseStatus.Passed, parent=cls)
+		JUnit4Testcase("tëst_ä", status=TestcaseStatus.Failed, parent=cls)
+		doc.AddTestsuite(ts)
+		doc.Aggregate()
+
+		doc.Write(junitOutputFile, regenerate=True, overwrite=True)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertIn("tëst_ü".encode("utf-8"), expected)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
 
 class PythonPyTest(TestCase):
 	def test_Read(self):
@@ -302,3 +514,66 @@ class PythonPyTest(TestCase):
 					self.assertEqual(tc.Status, sameTC.Status)
 					self.assertEqual(tc.Duration, sameTC.Duration)
 					self.assertEqual(tc.AssertionCount, sameTC.AssertionCount)
+
+	def test_AnalyzeAndConvert(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Python-pytest/TestReportSummary.xml")
+		streamedDoc = PyTestDocument(junitExampleFile)
+		streamedDoc.AnalyzeAndConvert()
+		doc = PyTestDocument(junitExampleFile, analyzeAndConvert=True)
+
+		self.assertIsNone(streamedDoc._xmlDocument)
+		self.assertEqual(doc.TestsuiteCount, streamedDoc.TestsuiteCount)
+		self.assertEqual(doc.TestcaseCount, streamedDoc.TestcaseCount)
+		self.assertEqual(doc.Status, streamedDoc.Status)
+
+	def test_WriteIncrementally(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Python-pytest/TestReportSummary.xml")
+		doc = PyTestDocument(junitExampleFile)
+		doc.AnalyzeAndConvert()
+
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Python-pytest/TestReportSummary.incremental.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc.Write(junitOutputFile, regenerate=True, overwrite=True)
+		self.assertIsNone(doc._xmlDocument)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_WriteIncrementally_Empty(self):
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Python-pytest/TestReportSummary.empty.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc = PyTestDocument(junitOutputFile)
+		doc.Aggregate()
+
+		doc.Write(junitOutputFile, regenerate=True, overwrite=True)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertTrue(expected.endswith(b"/>\n"))
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_WriteFast(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Python-pytest/TestReportSummary.xml")
+		doc = PyTestDocument(junitExampleFile)
+		doc.AnalyzeAndConvert()
+
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Python-pytest/TestReportSummary.fast.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc.WriteFast(junitOutputFile, overwrite=True)
+		self.assertIsNone(doc._xmlDocument)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_Write(self):
+		junitExampleFile = Path("tests/data/JUnit/pyEDAA.Reports/Python-pytest/TestReportSummary.xml")
+		doc = PyTestDocument(junitExampleFile, analyzeAndConvert=True)
+
+		junitOutputFile = Path("tests/output/JUnit/pyEDAA.Reports/Python-pytest/TestReportSummary.unchanged.xml")
+		junitOutputFile.parent.mkdir(parents=True, exist_ok=True)
+		doc.Write(junitOutputFile, overwrite=True)
+
+		expected = tostring(parse(str(junitExampleFile)), encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
@@ -32,6 +32,10 @@ from datetime import timedelta, datetime
 from pathlib  import Path
 from unittest import TestCase as py_TestCase
 
+from lxml.etree       import tostring, parse, fromstring
+from pyTooling.Common import getResourceFile
+
+from pyEDAA.Reports                   import Resources
 from pyEDAA.Reports.Unittesting       import TestcaseStatus, TestsuiteStatus, TestsuiteKind
 from pyEDAA.Reports.Unittesting       import TestsuiteSummary as ut_TestsuiteSummary
 from pyEDAA.Reports.Unittesting       import Testsuite as ut_Testsuite, Testcase as ut_Testcase
@@ -305,6 +309,18 @@ class TestsuiteInTestsuiteSummary(py_TestCase):
 		for testsuite in testsuites3:
 			self.assertEqual(tss, testsuite.Parent)
 
+	def test_AddTestsuites_WrongType(self) -> None:
+		ts1 = Testsuite("ts1")
+		tss = TestsuiteSummary("tss")
+
+		with self.assertRaises(TypeError):
+			tss.AddTestsuite(Testclass("cls1"))
+		with self.assertRaises(TypeError):
+			tss.AddTestsuites((ts1, Testclass("cls2")))
+
+		self.assertEqual(0, tss.TestsuiteCount)
+		self.assertIsNone(ts1.Parent)
+
 
 class Hierarchy(py_TestCase):
 	def test_Simple(self) -> None:
@@ -409,6 +425,16 @@ class Conversion(py_TestCase):
 
 		self.assertEqual("tss", juTSS.Name)
 
+	def test_FromTestsuiteSummary_WithTestsuites(self) -> None:
+		tss = ut_TestsuiteSummary("tss")
+		ts = ut_Testsuite("ts", parent=tss)
+		_ = ut_Testcase("tc", parent=ts)
+		juTSS = TestsuiteSummary.FromTestsuiteSummary(tss)
+
+		self.assertEqual(1, len(juTSS.Testsuites))
+		self.assertIsInstance(juTSS.Testsuites["ts"], Testsuite)
+		self.assertIn("tc", juTSS.Testsuites["ts"].Testclasses["ts"].Testcases)
+
 
 class Document(py_TestCase):
 	_outputDirectory = Path("tests/output/JUnit_Document")
@@ -452,12 +478,164 @@ class Document(py_TestCase):
 		self.assertGreater(doc.AnalysisDuration, zeroTime)
 		self.assertGreater(doc.ModelConversionDuration, zeroTime)
 
+	def test_AnalyzeAndConvert(self) -> None:
+		junitExampleFile = Path("tests/data/JUnit/pyAttributes/pytest.pyAttributes.xml")
+		streamedDoc = JUnitDocument(junitExampleFile)
+		streamedDoc.AnalyzeAndConvert()
+		doc = JUnitDocument(junitExampleFile, analyzeAndConvert=True)
+
+		self.assertIsNone(streamedDoc._xmlDocument)
+		self.assertEqual(doc.TestsuiteCount, streamedDoc.TestsuiteCount)
+		self.assertEqual(doc.TestcaseCount, streamedDoc.TestcaseCount)
+		self.assertEqual(doc.Status, streamedDoc.Status)
+		self.assertListEqual(
+			[ts.Name for ts in doc._testsuites.values()],
+			[ts.Name for ts in streamedDoc._testsuites.values()]
+		)
+
+	def test_AnalyzeAndConvert_NotAFile(self) -> None:
+		doc = JUnitDocument(Path("tests/data/JUnit"))
+
+		with self.assertRaises(UnittestException):
+			doc.AnalyzeAndConvert()
+
+	def test_AnalyzeAndConvert_FileNotFound(self) -> None:
+		doc = JUnitDocument(Path("tests/data/JUnit/missing.xml"))
+
+		with self.assertRaises(UnittestException):
+			doc.AnalyzeAndConvert()
+
+	def test_Analyze_ValidationError(self) -> None:
+		junitExampleFile = self._outputDirectory / "Analyze_ValidationError.xml"
+		junitExampleFile.write_text("<unknown/>\n")
+		schemaFile = getResourceFile(Resources, "Any-JUnit.xsd")
+
+		for doc in (JUnitDocument(junitExampleFile), JUnitDocument(junitExampleFile)):
+			with self.assertRaises(UnittestException) as context:
+				doc.Analyze()
+			self.assertIn(f"'{schemaFile}'", str(context.exception))
+
+			with self.assertRaises(UnittestException) as context:
+				doc.AnalyzeAndConvert()
+			self.assertIn(f"'{schemaFile}'", str(context.exception))
+
+	def test_ConvertTestcaseChildren_LastStatusWins(self) -> None:
+		doc = JUnitDocument(Path("tests/data/JUnit/pyAttributes/pytest.pyAttributes.xml"))
+		testcaseNode = fromstring("<testcase name='tc'><skipped/><system-out/><!-- comment --><failure/></testcase>")
+		tc = Testcase("tc")
+
+		doc._ConvertTestcaseChildren(testcaseNode, tc)
+		self.assertEqual(TestcaseStatus.Failed, tc.Status)
+
+	def test_ConvertTestcaseChildren_UnknownElement(self) -> None:
+		doc = JUnitDocument(Path("tests/data/JUnit/pyAttributes/pytest.pyAttributes.xml"))
+		testcaseNode = fromstring("<testcase name='tc'><unknown/></testcase>")
+
+		with self.assertRaises(UnittestException):
+			doc._ConvertTestcaseChildren(testcaseNode, Testcase("tc"))
+
+	def test_IterateTestcases(self) -> None:
+		junitExampleFile = Path("tests/data/JUnit/pyAttributes/pytest.pyAttributes.xml")
+		doc = JUnitDocument(junitExampleFile, analyzeAndConvert=True)
+
+		testcases = [tc for ts in doc._testsuites.values() for tc in ts.IterateTestcases()]
+		self.assertEqual(doc.TestcaseCount, len(testcases))
+		self.assertTrue(all(isinstance(tc, Testcase) for tc in testcases))
+
 	def test_ReadWrite(self) -> None:
 		junitExampleFile = Path("tests/data/JUnit/pyAttributes/pytest.pyAttributes.xml")
 		doc = JUnitDocument(junitExampleFile, analyzeAndConvert=True)
 
 		doc.Write(self._outputDirectory / "ReadWrite.xml")
 
+	def test_WriteIncrementally(self) -> None:
+		junitExampleFile = Path("tests/data/JUnit/pyAttributes/pytest.pyAttributes.xml")
+		junitOutputFile = self._outputDirectory / "WriteIncrementally.xml"
+		doc = JUnitDocument(junitExampleFile)
+		doc.AnalyzeAndConvert()
+
+		doc.Write(junitOutputFile, overwrite=True, regenerate=True)
+		self.assertIsNone(doc._xmlDocument)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_WriteIncrementally_Empty(self) -> None:
+		junitExampleFile = Path("tests/data/JUnit/OsvvmLibraries/OSVVMLibraries_OsvvmLibraries.xml")
+		junitOutputFile = self._outputDirectory / "WriteIncrementally_Empty.xml"
+		doc = JUnitDocument(junitExampleFile, analyzeAndConvert=True)
+		self.assertEqual(0, doc.TestsuiteCount)
+
+		doc.Write(junitOutputFile, overwrite=True, regenerate=True)
+
+		doc.Generate(overwrite=True)
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertTrue(expected.endswith(b"/>\n"))
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_WriteIncrementally_NonASCII(self) -> None:
+		junitOutputFile = self._outputDirectory / "WriteIncrementally_NonASCII.xml"
+		doc = JUnitDocument(junitOutputFile)
+		ts = Testsuite("tests/test_ünïcode.py", startTime=datetime.fromisoformat("2024-02-24T12:12:12+01:00"))
+		cls = Testclass("test_ünïcode.Tëst", parent=ts)
+		Testcase("tëst_ü", status=TestcaseStatus.Passed, parent=cls)
+		Testcase("tëst_ä", status=TestcaseStatus.Failed, parent=cls)
+		doc.AddTestsuite(ts)
+		doc.Aggregate()
+
+		doc.Write(junitOutputFile, overwrite=True, regenerate=True)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertIn("tests/test_ünïcode.py".encode("utf-8"), expected)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_Write_AfterAnalyzeAndConvert(self) -> None:
+		junitExampleFile = Path("tests/data/JUnit/pyAttributes/pytest.pyAttributes.xml")
+		doc = JUnitDocument(junitExampleFile)
+		doc.AnalyzeAndConvert()
+
+		with self.assertRaises(UnittestException):
+			doc.Write(self._outputDirectory / "Write_AfterAnalyzeAndConvert.xml", overwrite=True)
+
+	def test_ReadWrite_KeepsFailureMessages(self) -> None:
+		junitExampleFile = Path("tests/data/JUnit/pyAttributes/pytest.pyAttributes.xml")
+		junitOutputFile = self._outputDirectory / "ReadWrite_KeepsFailureMessages.xml"
+		doc = JUnitDocument(junitExampleFile, analyzeAndConvert=True)
+
+		doc.Write(junitOutputFile, overwrite=True)
+
+		expected = parse(str(junitExampleFile)).xpath("//failure/@message")
+		self.assertGreater(len(expected), 0)
+		self.assertListEqual(expected, parse(str(junitOutputFile)).xpath("//failure/@message"))
+
+	def test_WriteFast(self) -> None:
+		junitExampleFile = Path("tests/data/JUnit/pyAttributes/pytest.pyAttributes.xml")
+		junitOutputFile = self._outputDirectory / "WriteFast.xml"
+		doc = JUnitDocument(junitExampleFile)
+		doc.AnalyzeAndConvert()
+
+		doc.WriteFast(junitOutputFile, overwrite=True)
+		self.assertIsNone(doc._xmlDocument)
+
+		doc.Generate()
+		expected = tostring(doc._xmlDocument, encoding="utf-8", xml_declaration=True, pretty_print=True)
+		self.assertEqual(expected, junitOutputFile.read_bytes())
+
+	def test_GenerateTimestamp(self) -> None:
+		doc = JUnitDocument(self._outputDirectory / "GenerateTimestamp.xml")
+		timestamp1 = datetime.fromisoformat("2024-02-24T12:12:12+01:00")
+		timestamp2 = datetime.fromisoformat("2024-02-24T12:12:13+01:00")
+
+		with self.assertRaises(AttributeError):
+			doc._GenerateTimestamp(None)
+		self.assertEqual("2024-02-24T12:12:12+01:00", doc._GenerateTimestamp(timestamp1))
+		self.assertEqual("2024-02-24T12:12:12+01:00", doc._GenerateTimestamp(timestamp1))
+		self.assertEqual("2024-02-24T12:12:13+01:00", doc._GenerateTimestamp(timestamp2))
+		with self.assertRaises(AttributeError):
+			doc._GenerateTimestamp(None)
+
 	def test_Generate(self) -> None:
 		print()
 		doc = JUnitDocument(self._outputDirectory / "Generate.xml")